@@ -0,0 +1,420 @@
+"""
+Load test for the GameServerStatus watcher loop.
+
+Runs the real cog against a local stand-in for the SS14 /status endpoint, fake
+Discord channels and messages and an in-memory Config, so no bot or game server
+is needed. Needs the same packages as the cog itself (Red-DiscordBot, aiohttp).
+
+    python benchmarks/watcher.py --sizes 10,100,1000 --latency 0.05
+
+For every watch count two iterations are measured: a cold one where every watch
+message gets its first edit, and a warm one where only `--churn` of the servers
+report a different player count. Fake servers are spread over several loopback
+addresses (127.0.0.x) so the per-host limits behave like a real fleet, use
+`--hosts 1` where only 127.0.0.1 is available.
+"""
+
+import argparse
+import asyncio
+import copy
+import gc
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import discord  # noqa: E402
+from aiohttp import web  # noqa: E402
+from redbot.core import Config  # noqa: E402
+
+import gameserverstatus.gameserverstatus as gss  # noqa: E402
+
+# Discord's documented edit limit per channel is roughly 5 per 5 seconds.
+CHANNEL_LIMIT = 5
+CHANNEL_WINDOW = 5.0
+
+FIRST_SNOWFLAKE = 1_300_000_000_000_000_000
+
+
+# -- In-memory Config
+
+
+class MemoryValue:
+    """Mimics the bits of Red's Value/Group API the cog uses."""
+
+    def __init__(self, store: Dict[str, Any], path: List[str]) -> None:
+        self._store = store
+        self._path = path
+
+    def _get(self) -> Any:
+        value: Any = self._store
+        for part in self._path:
+            value = value[part]
+        return value
+
+    def __getattr__(self, name: str) -> "MemoryValue":
+        return MemoryValue(self._store, self._path + [name])
+
+    def __call__(self) -> "MemoryValueContext":
+        return MemoryValueContext(self)
+
+    async def all(self) -> Any:
+        return copy.deepcopy(self._get())
+
+    async def set(self, value: Any) -> None:
+        parent: Any = self._store
+        for part in self._path[:-1]:
+            parent = parent[part]
+        parent[self._path[-1]] = value
+
+
+class MemoryValueContext:
+    def __init__(self, value: MemoryValue) -> None:
+        self._value = value
+
+    def __await__(self):
+        return self._value.all().__await__()
+
+    async def __aenter__(self) -> Any:
+        # Mutations go straight to the store, like Red saving on exit.
+        return self._value._get()
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+class MemoryConfig:
+    def __init__(self) -> None:
+        self._globals: Dict[str, Any] = {}
+        self._guild_defaults: Dict[str, Any] = {}
+        self._guilds: Dict[int, Dict[str, Any]] = {}
+
+    def register_global(self, **defaults: Any) -> None:
+        self._globals.update(copy.deepcopy(defaults))
+
+    def register_guild(self, **defaults: Any) -> None:
+        self._guild_defaults.update(copy.deepcopy(defaults))
+
+    def guild_from_id(self, guild_id: int) -> MemoryValue:
+        if guild_id not in self._guilds:
+            self._guilds[guild_id] = copy.deepcopy(self._guild_defaults)
+        return MemoryValue(self._guilds, [guild_id])
+
+    def guild(self, guild: Any) -> MemoryValue:
+        return self.guild_from_id(guild.id)
+
+    def get_attr(self, name: str) -> MemoryValue:
+        return MemoryValue({"globals": self._globals}, ["globals", name])
+
+    def __getattr__(self, name: str) -> MemoryValue:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get_attr(name)
+
+    async def all(self) -> Dict[str, Any]:
+        return copy.deepcopy(self._globals)
+
+    async def all_guilds(self) -> Dict[int, Dict[str, Any]]:
+        return copy.deepcopy(self._guilds)
+
+
+# -- Fake Discord
+
+
+class FakeResponse:
+    status = 404
+    reason = "Not Found"
+
+
+class FakeMessage:
+    __slots__ = ("channel", "id")
+
+    def __init__(self, channel: "FakeChannel", message_id: int) -> None:
+        self.channel = channel
+        self.id = message_id
+
+    @property
+    def guild(self) -> Any:
+        return self.channel.guild
+
+    async def edit(self, **kwargs: Any) -> "FakeMessage":
+        await self.channel.bot.rate_limit(self.channel)
+        self.channel.bot.calls["edit"] += 1
+        if self.id not in self.channel.messages:
+            raise discord.NotFound(FakeResponse(), "Unknown Message")
+        return self
+
+
+class FakeChannel:
+    def __init__(self, bot: "FakeBot", channel_id: int, guild: Any) -> None:
+        self.bot = bot
+        self.id = channel_id
+        self.guild = guild
+        self.messages: set = set()
+        self.recent: Deque[float] = deque()
+
+    async def send(self, **kwargs: Any) -> FakeMessage:
+        message = FakeMessage(self, self.bot.next_snowflake())
+        self.messages.add(message.id)
+        return message
+
+    def get_partial_message(self, message_id: int) -> FakeMessage:
+        return FakeMessage(self, message_id)
+
+    async def fetch_message(self, message_id: int) -> FakeMessage:
+        await self.bot.rate_limit(self)
+        self.bot.calls["fetch"] += 1
+        if message_id not in self.messages:
+            raise discord.NotFound(FakeResponse(), "Unknown Message")
+        return FakeMessage(self, message_id)
+
+
+class FakeBot:
+    """Records Discord calls and makes them wait like discord.py does on a 429."""
+
+    def __init__(self, global_limit: int) -> None:
+        self.channels: Dict[int, FakeChannel] = {}
+        self.calls: Counter = Counter()
+        self.global_limit = global_limit
+        self.recent: Deque[float] = deque()
+        self._snowflake = FIRST_SNOWFLAKE
+
+    def next_snowflake(self) -> int:
+        # Real IDs are spaced by the timestamp bits, keep them realistic for hashing.
+        self._snowflake += random.randint(1, 1 << 22) << 22
+        return self._snowflake
+
+    async def rate_limit(self, channel: FakeChannel) -> None:
+        buckets = [(channel.recent, CHANNEL_LIMIT, CHANNEL_WINDOW)]
+        if self.global_limit:
+            buckets.append((self.recent, self.global_limit, 1.0))
+
+        while True:
+            now = time.monotonic()
+            wait = 0.0
+            for recent, limit, window in buckets:
+                while recent and now - recent[0] >= window:
+                    recent.popleft()
+                if len(recent) >= limit:
+                    wait = max(wait, window - (now - recent[0]))
+            if wait <= 0:
+                break
+
+            self.calls["429"] += 1
+            await asyncio.sleep(wait)
+
+        for recent, _, _ in buckets:
+            recent.append(time.monotonic())
+
+    def get_channel(self, channel_id: int) -> Optional[FakeChannel]:
+        return self.channels.get(channel_id)
+
+    def get_cog(self, name: str) -> None:
+        return None
+
+    async def get_embed_color(self, location: Any) -> discord.Color:
+        return discord.Color.blurple()
+
+    async def wait_until_ready(self) -> None:
+        pass
+
+
+# -- Fake SS14 servers
+
+
+class FakeFleet:
+    """Serves /status for any number of fake SS14 servers on a few loopback hosts."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.players: Dict[str, int] = {}
+        self.requests = 0
+        self._runner: Optional[web.AppRunner] = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        server = request.match_info["server"]
+        latency = max(0.0, random.gauss(self.args.latency, self.args.latency / 4))
+        await asyncio.sleep(latency)
+
+        roll = random.random()
+        if roll < self.args.hang_rate:
+            await asyncio.sleep(3600)
+        if roll < self.args.hang_rate + self.args.failure_rate:
+            return web.Response(status=500, text="Internal Server Error")
+
+        return web.json_response(
+            {
+                "name": f"Benchmark {server}",
+                "players": self.players.setdefault(server, random.randint(0, 80)),
+                "soft_max_players": 80,
+                "map": "Box Station",
+                "preset": "Secret",
+                "round_id": 1234,
+                "run_level": 1,
+                "round_start_time": "2024-01-01T00:00:00Z",
+            }
+        )
+
+    def churn(self, fraction: float) -> None:
+        for server in random.sample(list(self.players), int(len(self.players) * fraction)):
+            self.players[server] += 1
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_get("/s/{server}/status", self.handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        for host in range(1, self.args.hosts + 1):
+            await web.TCPSite(self._runner, f"127.0.0.{host}", self.args.port).start()
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def address(self, server: int) -> str:
+        host = server % self.args.hosts + 1
+        return f"ss14://127.0.0.{host}:{self.args.port}/s/{server}"
+
+
+# -- Driver
+
+
+async def make_cog(bot: FakeBot, data_dir: Path, args: argparse.Namespace) -> gss.GameServerStatus:
+    Config.get_conf = staticmethod(lambda *args, **kwargs: MemoryConfig())
+    gss.cog_data_path = lambda *args, **kwargs: data_dir
+    cog = gss.GameServerStatus(bot)
+    cog.printer.cancel()
+    await cog.config.watch_partial_messages.set(not args.fetch_messages)
+    await cog.config.watch_edit_window.set(args.edit_window)
+    await cog.config.watch_edit_rate.set(args.edit_rate)
+    # The cold iteration should bring every watch online at once.
+    await cog.config.watch_warmup_window.set(0)
+    await cog.apply_settings()
+    # Every poll in the benchmark should reach the fake servers.
+    cog.status_cache.ttl = 0
+    return cog
+
+
+async def populate(cog: gss.GameServerStatus, bot: FakeBot, fleet: FakeFleet, watches: int, args: argparse.Namespace) -> None:
+    servers = max(1, watches // args.watches_per_server)
+    channels = max(1, watches // args.watches_per_channel)
+    guild = type("Guild", (), {"id": 1})()
+    for channel_id in range(1, channels + 1):
+        bot.channels[channel_id] = FakeChannel(bot, channel_id, guild)
+
+    server_config = {
+        f"s{n}": {"type": "ss14", "address": fleet.address(n), "name": None}
+        for n in range(servers)
+    }
+    watch_config = []
+    for n in range(watches):
+        channel = bot.channels[n % channels + 1]
+        message = await channel.send()
+        watch_config.append({"message": message.id, "server": f"s{n % servers}", "channel": channel.id})
+
+    await cog.config.guild_from_id(guild.id).servers.set(server_config)
+    await cog.config.guild_from_id(guild.id).watches.set(watch_config)
+
+
+async def iteration(cog: gss.GameServerStatus, bot: FakeBot, fleet: FakeFleet, watches: int, trace: bool) -> Dict[str, float]:
+    # Make every server due right away.
+    now = time.monotonic()
+    for key in cog.poll_scheduler.keys():
+        cog.poll_scheduler.schedule(key, now)
+
+    bot.calls.clear()
+    fleet.requests = 0
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    await cog.printer.coro(cog)
+    # Polls run as their own tasks and edits are sent by the cog's edit worker, wait for
+    # both to finish. The worker may be holding the last edit back for its rate limit,
+    # so check again after that.
+    while True:
+        while cog.poll_tasks or len(cog.edit_outbox) or cog.edits_in_flight:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(1 / cog.watch_edit_rate + 0.01)
+        if not cog.poll_tasks and not len(cog.edit_outbox) and not cog.edits_in_flight:
+            break
+    elapsed = time.perf_counter() - started
+
+    peak = 0
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    discord_calls = bot.calls["fetch"] + bot.calls["edit"]
+    return {
+        "wall": elapsed,
+        "rps": fleet.requests / elapsed if elapsed else 0.0,
+        "peak_mib": peak / (1 << 20),
+        "calls_per_watch": discord_calls / watches,
+        "edits": bot.calls["edit"],
+        "429s": bot.calls["429"],
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    fleet = FakeFleet(args)
+    await fleet.start()
+    print(
+        f"{'watches':>8} {'phase':>5} {'wall s':>8} {'req/s':>9} {'peak MiB':>9} "
+        f"{'calls/watch':>11} {'edits':>7} {'429s':>6}"
+    )
+    try:
+        for watches in args.sizes:
+            with tempfile.TemporaryDirectory() as data_dir:
+                bot = FakeBot(args.global_limit)
+                cog = await make_cog(bot, Path(data_dir), args)
+                try:
+                    await populate(cog, bot, fleet, watches, args)
+                    for phase in ("cold", "warm"):
+                        if phase == "warm":
+                            fleet.churn(args.churn)
+                        result = await iteration(cog, bot, fleet, watches, not args.no_tracemalloc)
+                        print(
+                            f"{watches:>8} {phase:>5} {result['wall']:>8.2f} {result['rps']:>9.1f} "
+                            f"{result['peak_mib']:>9.2f} {result['calls_per_watch']:>11.2f} "
+                            f"{result['edits']:>7} {result['429s']:>6}"
+                        )
+                finally:
+                    await cog.cog_unload()
+    finally:
+        await fleet.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="Comma separated watch counts to run.")
+    parser.add_argument("--watches-per-server", type=int, default=5)
+    parser.add_argument("--watches-per-channel", type=int, default=10)
+    parser.add_argument("--hosts", type=int, default=16, help="Loopback addresses to spread fake servers over.")
+    parser.add_argument("--port", type=int, default=18914)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean fake server latency in seconds.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of requests answered with a 500.")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="Fraction of requests that never get an answer.")
+    parser.add_argument("--churn", type=float, default=0.2, help="Fraction of servers that change between iterations.")
+    parser.add_argument("--global-limit", type=int, default=50, help="Fake Discord global requests per second, 0 for none.")
+    parser.add_argument("--edit-window", type=float, default=0.0, help="Seconds watch edits are spread over, 0 sends them in the same iteration.")
+    parser.add_argument("--edit-rate", type=float, default=50.0, help="Watch edits the cog may send per second.")
+    parser.add_argument("--fetch-messages", action="store_true", help="Fetch watch messages before editing them.")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="Skip peak memory tracking, it slows things down.")
+    args = parser.parse_args()
+    args.sizes = [int(size) for size in args.sizes.split(",")]
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
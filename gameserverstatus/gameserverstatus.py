@@ -1,19 +1,47 @@
 import aiohttp
+import asyncio
 import dateutil.parser
+import functools
 import logging
+import socket
+import time
 
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, TypeVar, Callable
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set, TypeVar, Callable, Tuple, cast
 from urllib.parse import urlparse, urlunparse
 
 import discord
 from discord import TextChannel
 from discord.ext import tasks
+from aiohttp import web
 
 from redbot.core import app_commands, commands, bot, Config, checks
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils import menus
 from redbot.core.utils.chat_formatting import pagify, humanize_timedelta
 
+from .utils.breaker import CircuitBreaker
+from .utils.events import StatusEvent, crossed_threshold, diff_status
+from .utils.gameservers import QSTAT_TYPES, SUPPORTED_QSTAT_TYPES
+from .utils.history import PlayerHistory
+from .utils.httpapi import LocalHTTPServer, json_response
+from .utils.metrics import RateLimitCounter, StatusMetrics
+from .utils.outbox import EditOutbox
+from .utils.registry import ServerIndex
+from .utils.resolver import CachingResolver
+from .utils.statefile import StateFile
+from .utils.scheduler import (
+    PollScheduler,
+    edit_slot_time,
+    next_poll_interval,
+    POLL_INTERVAL_MIN,
+    POLL_INTERVAL_MAX,
+)
+from .utils.ss13_parser import ByondTopicClient, get_ss13_status_addr, parse_ss13_status
+from .utils.statuscache import Snapshot, StatusCache
+from .utils.udpquery import UDPQueryEngine, get_udp_status_addr
+from .utils.uptime import UptimeTracker
+
 log = logging.getLogger("red.wizard-cogs.gameserverstatus")
 
 SS14_RUN_LEVEL_STATUS = {
@@ -22,12 +50,174 @@ SS14_RUN_LEVEL_STATUS = {
     2: "Ending",
 }
 
+# Bot-wide knobs, adjustable by the bot owner with `statuscfg tuning set`.
+# key: (type, minimum, maximum, description)
+TUNABLES: Dict[str, Tuple[type, float, float, str]] = {
+    "watch_concurrency": (
+        int, 1, 512, "Maximum number of server polls, and separately of watch messages updated, in progress at the same time."
+    ),
+    "watch_host_concurrency": (
+        int, 1, 64, "Maximum number of status requests in flight at the same time for a single game server host."
+    ),
+    "watch_deadline": (
+        float, 5, 55, "Seconds a single server poll may run before it is abandoned."
+    ),
+    "status_cache_ttl": (
+        float, 0, 300, "Seconds a fetched server status is reused before it is fetched again."
+    ),
+    "status_cache_size": (
+        int, 16, 100000, "Maximum number of server statuses kept in the status cache."
+    ),
+    "watch_time_granularity": (
+        int, 1, 60, "Minutes the round time shown in watches is rounded down to."
+    ),
+    "watch_partial_messages": (
+        bool, 0, 1, "Edit watch messages directly instead of fetching them first."
+    ),
+    "watch_edit_window": (
+        float, 0, 300, "Seconds watch edits are spread over, every watch gets a fixed slot in it. 0 edits right after each poll."
+    ),
+    "watch_edit_rate": (
+        float, 0.5, 50, "Maximum number of watch edits sent per second, across all guilds."
+    ),
+    "watch_warmup_window": (
+        float, 0, 600, "Seconds watches are brought online over after a restart, once the status cache is warm."
+    ),
+    "status_connect_timeout": (
+        float, 0.5, 30, "Seconds to wait for a connection to a game server."
+    ),
+    "status_read_timeout": (
+        float, 0.5, 30, "Seconds to wait for a game server to send more of its response."
+    ),
+    "status_total_timeout": (
+        float, 1, 60, "Seconds a whole status request may take."
+    ),
+    "http_enabled": (
+        bool, 0, 1, "Run the local HTTP endpoint serving Prometheus metrics on /metrics "
+        "and cached server status as JSON on /guilds/<guild ID>/servers[/<name>]."
+    ),
+    "http_host": (
+        str, 0, 0, "Address the local HTTP endpoint binds to."
+    ),
+    "http_port": (
+        int, 1, 65535, "Port the local HTTP endpoint listens on."
+    ),
+}
+
+DEFAULT_GLOBAL: Dict[str, Any] = {
+    "watch_concurrency": 32,
+    "watch_host_concurrency": 4,
+    "watch_deadline": 50.0,
+    "status_cache_ttl": 20.0,
+    "status_cache_size": 1024,
+    "watch_time_granularity": 5,
+    "watch_partial_messages": True,
+    "watch_edit_window": 60.0,
+    "watch_edit_rate": 10.0,
+    "watch_warmup_window": 60.0,
+    "status_connect_timeout": 3.0,
+    "status_read_timeout": 5.0,
+    "status_total_timeout": 10.0,
+    "http_enabled": False,
+    "http_host": "127.0.0.1",
+    "http_port": 9184,
+}
+
+# Connection pool for status requests. Servers are polled over and over,
+# so keep sockets and DNS answers around between polls.
+STATUS_CONNECTION_LIMIT = 100
+STATUS_CONNECTION_LIMIT_PER_HOST = 8
+STATUS_KEEPALIVE_TIMEOUT = 120
+# Seconds DNS answers are kept, and failed lookups before they are tried again.
+# The resolver is shared with poweractions.
+STATUS_DNS_CACHE_TTL = 300
+STATUS_DNS_NEGATIVE_TTL = 30
+
+# Consecutive failed queries before a server's circuit opens, and the seconds between
+# probes while it is open. The wait doubles with every failed probe up to the maximum.
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 30.0
+BREAKER_MAX_COOLDOWN = 600.0
+
+# BYOND answers topics on its game thread, don't pile queries onto one server.
+BYOND_HOST_CONCURRENCY = 2
+
+# Resends of a UDP status query before the server is considered unreachable.
+UDP_QUERY_RETRIES = 2
+
+# Seconds between rebuilds of the watch table when nothing marked it dirty.
+WATCH_TABLE_REFRESH = 60.0
+
+# Seconds a status fetched while warming up may still be shown by a server's first poll.
+WARMUP_REUSE_AGE = 60.0
+
+# Seconds the state saved when the cog unloads stays usable. Older snapshots are
+# dropped one by one, a file saved longer ago than this is ignored as a whole.
+STATE_MAX_AGE = 900.0
+
+# Seconds to hold back an edit for a message that is still being edited.
+EDIT_RETRY_DELAY = 1.0
+
+# Servers shown on each page of `status all`.
+FLEET_PAGE_SIZE = 8
+
+# Servers per panel message. Each takes 4 components and a message may hold 40,
+# bigger panels are split over several messages.
+PANEL_MAX_SERVERS = 10
+
+# Seconds between writes of the player count history to disk.
+HISTORY_FLUSH_INTERVAL = 300.0
+
+# Look-back windows of `statushistory` and `statusuptime`. Type checkers only see the timedelta
+# the converters produce, a converter instance is not a valid annotation.
+if TYPE_CHECKING:
+    HistoryWindow = timedelta
+    UptimeWindow = timedelta
+else:
+    HistoryWindow = commands.TimedeltaConverter(
+        minimum=timedelta(hours=1),
+        maximum=timedelta(days=730),
+        allowed_units=["hours", "days", "weeks"],
+        default_unit="days",
+    )
+    UptimeWindow = commands.TimedeltaConverter(
+        minimum=timedelta(hours=1),
+        maximum=timedelta(days=90),
+        allowed_units=["hours", "days", "weeks"],
+        default_unit="days",
+    )
+
 
 class StatusFetchError(Exception):
     pass
 
 
+class StatusTimeoutError(StatusFetchError):
+    """The game server did not answer within the configured timeouts."""
+    pass
+
+
+class StatusUnreachableError(StatusFetchError):
+    """
+    The game server's circuit is open, so it was not contacted at all.
+
+    `since` is when the server started failing, `snapshot` the last status it did answer with.
+    """
+
+    def __init__(self, since: float, snapshot: Optional["Snapshot"]) -> None:
+        super().__init__(since, snapshot)
+        self.since = since
+        self.snapshot = snapshot
+
+
 class SS14ServerStatus(discord.ui.LayoutView):
+    """
+    Status of a single server.
+
+    Watches keep their view and `update` it in place for every new status. There is
+    nothing to interact with, so the view never times out.
+    """
+
     def __init__(
         self,
         *,
@@ -39,45 +229,265 @@ class SS14ServerStatus(discord.ui.LayoutView):
         round_id: str,
         color: discord.Color,
     ):
-        super().__init__()
+        super().__init__(timeout=None)
 
-        self.container = discord.ui.Container(
-            discord.ui.TextDisplay(content=f"**{name}**"),
+        self.name_text: discord.ui.TextDisplay["SS14ServerStatus"] = discord.ui.TextDisplay(content="")
+        self.status_text: discord.ui.TextDisplay["SS14ServerStatus"] = discord.ui.TextDisplay(content="")
+        self.container: discord.ui.Container["SS14ServerStatus"] = discord.ui.Container(
+            self.name_text,
             discord.ui.Separator(visible=True, spacing=discord.SeparatorSpacing.small),
-            discord.ui.TextDisplay(
-                content=f"**Players:** {player_count}\n**Status:** {status}\n**Map:** {gamemap}\n**Preset:** {preset}"
-            ),
-            accent_color=color,
+            self.status_text,
         )
-        self.footer_text = discord.ui.TextDisplay(content=f"-# Round ID: {round_id}")
+        self.footer_text: discord.ui.TextDisplay["SS14ServerStatus"] = discord.ui.TextDisplay(content="")
 
         self.add_item(self.container)
         self.add_item(self.footer_text)
+        self.update(
+            name=name,
+            player_count=player_count,
+            status=status,
+            gamemap=gamemap,
+            preset=preset,
+            round_id=round_id,
+            color=color,
+        )
+
+    def update(
+        self,
+        *,
+        name: str,
+        player_count: str,
+        status: str,
+        gamemap: str,
+        preset: str,
+        round_id: str,
+        color: discord.Color,
+    ) -> None:
+        self.name_text.content = f"**{name}**"
+        self.status_text.content = f"**Players:** {player_count}\n**Status:** {status}\n**Map:** {gamemap}\n**Preset:** {preset}"
+        self.footer_text.content = f"-# Round ID: {round_id}"
+        self.container.accent_color = color
+
+
+class SS14StatusPanelEntry(discord.ui.Container):
+    """One server of a status panel, see SS14StatusPanel."""
+
+    def __init__(self) -> None:
+        self.label_text: discord.ui.TextDisplay["SS14StatusPanel"] = discord.ui.TextDisplay(content="")
+        self.status_text: discord.ui.TextDisplay["SS14StatusPanel"] = discord.ui.TextDisplay(content="")
+        super().__init__(
+            self.label_text,
+            discord.ui.Separator(visible=True, spacing=discord.SeparatorSpacing.small),
+            self.status_text,
+        )
+
+    def update(self, label: str, fields: Optional[Dict[str, str]], color: discord.Color) -> None:
+        if fields is None:
+            self.label_text.content = f"**{label}**"
+            self.status_text.content = "Status unavailable."
+            self.accent_color = discord.Color.dark_grey()
+        else:
+            self.label_text.content = f"**{fields['name']}**"
+            self.status_text.content = f"**Players:** {fields['player_count']}\n**Status:** {fields['status']}\n**Map:** {fields['gamemap']}\n**Preset:** {fields['preset']}\n-# Round ID: {fields['round_id']}"
+            self.accent_color = color
+
+
+class SS14StatusPanel(discord.ui.LayoutView):
+    """
+    Status of several servers in one message, a container per server.
+
+    `entries` holds (label, rendered status) pairs, a missing status is shown as unavailable
+    under the label. Like SS14ServerStatus it is updated in place and never times out.
+    """
+
+    def __init__(
+        self,
+        *,
+        entries: List[Tuple[str, Optional[Dict[str, str]]]],
+        color: discord.Color,
+    ):
+        super().__init__(timeout=None)
+        self.update(entries=entries, color=color)
+
+    def update(
+        self,
+        *,
+        entries: List[Tuple[str, Optional[Dict[str, str]]]],
+        color: discord.Color,
+    ) -> None:
+        if len(self.children) != len(entries):
+            self.clear_items()
+            for _ in entries:
+                self.add_item(SS14StatusPanelEntry())
+
+        for container, (label, fields) in zip(self.children, entries):
+            cast(SS14StatusPanelEntry, container).update(label, fields, color)
 
 
 class GameServerStatus(commands.Cog):
     def __init__(self, bot: bot.Red) -> None:
         self.bot = bot
         self.config = Config.get_conf(self, identifier=5645456348)
+        self.resolver = CachingResolver(
+            ttl=STATUS_DNS_CACHE_TTL,
+            negative_ttl=STATUS_DNS_NEGATIVE_TTL,
+        )
         self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=STATUS_CONNECTION_LIMIT,
+                limit_per_host=STATUS_CONNECTION_LIMIT_PER_HOST,
+                keepalive_timeout=STATUS_KEEPALIVE_TIMEOUT,
+                resolver=self.resolver,
+                # The resolver caches on its own, failures included.
+                use_dns_cache=False,
+            ),
             headers={
                 "User-Agent": "Py Aiohttp - Wizard-cogs/GameServerStatus (+https://github.com/space-wizards/wizard-cogs)"
-            }
+            },
+        )
+        self.status_timeout = aiohttp.ClientTimeout(
+            total=DEFAULT_GLOBAL["status_total_timeout"],
+            sock_connect=DEFAULT_GLOBAL["status_connect_timeout"],
+            sock_read=DEFAULT_GLOBAL["status_read_timeout"],
+        )
+        self.byond_client = ByondTopicClient(
+            timeout=DEFAULT_GLOBAL["status_total_timeout"],
+            host_concurrency=BYOND_HOST_CONCURRENCY,
+        )
+        self.udp_engine = UDPQueryEngine(
+            timeout=DEFAULT_GLOBAL["status_total_timeout"],
+            retries=UDP_QUERY_RETRIES,
         )
 
-        default_guild: Dict[str, Any] = {"servers": {}, "watches": [], "slashcommandvisible": True}
+        default_guild: Dict[str, Any] = {
+            "servers": {},
+            "watches": [],
+            "event_routes": [],
+            "slashcommandvisible": True,
+        }
         self.config.register_guild(**default_guild)
+        self.config.register_global(**DEFAULT_GLOBAL)
+
+        self.status_cache = StatusCache(
+            ttl=DEFAULT_GLOBAL["status_cache_ttl"],
+            maxsize=DEFAULT_GLOBAL["status_cache_size"],
+        )
+        self.breaker = CircuitBreaker(
+            threshold=BREAKER_THRESHOLD,
+            cooldown=BREAKER_COOLDOWN,
+            max_cooldown=BREAKER_MAX_COOLDOWN,
+        )
+        self.watch_time_granularity = DEFAULT_GLOBAL["watch_time_granularity"]
+        self.watch_partial_messages = DEFAULT_GLOBAL["watch_partial_messages"]
+        self.watch_edit_window = DEFAULT_GLOBAL["watch_edit_window"]
+        self.watch_edit_rate = DEFAULT_GLOBAL["watch_edit_rate"]
+        self.watch_deadline = DEFAULT_GLOBAL["watch_deadline"]
+        self.watch_host_concurrency = DEFAULT_GLOBAL["watch_host_concurrency"]
+        # Status URL -> the poll of that server in progress, see start_poll.
+        self.poll_tasks: Dict[str, "asyncio.Task[None]"] = {}
+        self.poll_semaphore = asyncio.Semaphore(DEFAULT_GLOBAL["watch_concurrency"])
+        # Game server host -> limit on the status requests in flight to it.
+        self.host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # (guild ID, watch, view, fingerprint) of renders waiting for their edit slot, see drain_edits.
+        self.edit_outbox: EditOutbox[Tuple[int, Dict[str, Any], discord.ui.LayoutView, int]] = EditOutbox()
+        self.edit_semaphore = asyncio.Semaphore(DEFAULT_GLOBAL["watch_concurrency"])
+        # Message ID -> fingerprint of the edit being sent to it right now.
+        self.edits_in_flight: Dict[int, int] = {}
+        # Message ID -> fingerprint of the status last rendered into that watch.
+        self.watch_fingerprints: Dict[int, int] = {}
+        # Message ID -> the view of that watch, updated in place for every render.
+        self.watch_views: Dict[int, discord.ui.LayoutView] = {}
+        # Guild ID -> message IDs of watches whose message is gone, see prune_dead_watches.
+        self.dead_watches: Dict[int, Set[int]] = {}
+
+        self.metrics = StatusMetrics()
+        self.ratelimit_counter = RateLimitCounter(self.metrics)
+        logging.getLogger("discord.http").addFilter(self.ratelimit_counter)
+        self.http_server = LocalHTTPServer(
+            [
+                web.get("/metrics", self.http_metrics),
+                web.get("/guilds/{guild_id}/servers", self.http_guild_status),
+                web.get("/guilds/{guild_id}/servers/{name}", self.http_server_status),
+            ]
+        )
+
+        # Status URL -> the server config and every watch showing it, see refresh_watch_table.
+        self.watch_table: Optional[Dict[str, Dict[str, Any]]] = None
+        self.watch_table_refreshed = 0.0
+        self.poll_scheduler: PollScheduler[str] = PollScheduler()
+        # Status URL -> the status payload last seen by the watcher, to diff new ones against.
+        self.event_snapshots: Dict[str, Dict[str, Any]] = {}
+        # Announcements being sent, kept off the poll path, see dispatch_events.
+        self.event_tasks: Set["asyncio.Task[None]"] = set()
+        # Guild ID -> search index over that guild's servers, see get_server_index.
+        self.server_indexes: Dict[int, ServerIndex] = {}
+        self.history = PlayerHistory(cog_data_path(self) / "history.sqlite3")
+        self.history_flushed = time.monotonic()
+        self.uptime = UptimeTracker(cog_data_path(self) / "uptime.sqlite3")
+        # Snapshots, circuits and poll times saved by the last unload, see restore_state.
+        self.state_file = StateFile(cog_data_path(self) / "state.json.gz")
+        self.state_restore: "Optional[asyncio.Task[None]]" = None
+        # Watch messages not updated since the cog started, None until warm_start has run.
+        self.started = time.monotonic()
+        self.warming_up: Optional[Set[int]] = None
 
         self.printer.start()
+        self.edit_worker = asyncio.create_task(self.drain_edits())
+
+    async def apply_settings(self) -> None:
+        """Pushes the stored tuning settings into the cog's runtime helpers."""
+        settings = await self.config.all()
+        self.status_cache.ttl = settings["status_cache_ttl"]
+        self.status_cache.maxsize = settings["status_cache_size"]
+        self.watch_time_granularity = settings["watch_time_granularity"]
+        self.watch_partial_messages = settings["watch_partial_messages"]
+        self.watch_edit_window = settings["watch_edit_window"]
+        self.watch_edit_rate = settings["watch_edit_rate"]
+        self.edit_semaphore = asyncio.Semaphore(settings["watch_concurrency"])
+        self.poll_semaphore = asyncio.Semaphore(settings["watch_concurrency"])
+        self.watch_deadline = settings["watch_deadline"]
+        if settings["watch_host_concurrency"] != self.watch_host_concurrency:
+            self.watch_host_concurrency = settings["watch_host_concurrency"]
+            self.host_semaphores = {}
+        self.status_timeout = aiohttp.ClientTimeout(
+            total=settings["status_total_timeout"],
+            sock_connect=settings["status_connect_timeout"],
+            sock_read=settings["status_read_timeout"],
+        )
+        self.byond_client.timeout = settings["status_total_timeout"]
+        self.udp_engine.timeout = settings["status_total_timeout"]
+
+        try:
+            if settings["http_enabled"]:
+                await self.http_server.start(settings["http_host"], settings["http_port"])
+            else:
+                await self.http_server.stop()
+        except OSError as e:
+            log.error("Could not start the local HTTP endpoint.", exc_info=e)
 
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild) -> None:
-        # Remove watchers
-        await self.config.guild(guild).watches.set({})
+        # Remove watchers and event routes, nothing is left to poll the guild's servers for.
+        await self.config.guild(guild).watches.set([])
+        await self.config.guild(guild).event_routes.set([])
+        self.watch_table = None
+        self.server_indexes.pop(guild.id, None)
 
     async def cog_unload(self) -> None:
-        await self.session.close()
         self.printer.cancel()
+        self.edit_worker.cancel()
+        for task in [*self.poll_tasks.values(), *self.event_tasks]:
+            task.cancel()
+        try:
+            await self.save_state()
+        except Exception as e:
+            log.error("Could not save the status cache.", exc_info=e)
+        await self.session.close()
+        self.udp_engine.close()
+        await self.history.close()
+        await self.uptime.close()
+        await self.http_server.stop()
+        logging.getLogger("discord.http").removeFilter(self.ratelimit_counter)
 
     @commands.command()
     @commands.guild_only()
@@ -90,6 +500,7 @@ class GameServerStatus(commands.Cog):
         """Shows status for a game server.
 
         Leave out server name to get a list of all servers.
+        Use `all` as the server name to see the status of every server at once.
         Set `legacy` to `True` to display the status as an old Discord embed.
         """
         if not server:
@@ -97,17 +508,24 @@ class GameServerStatus(commands.Cog):
             return
 
         async with ctx.typing():
-            server = server.lower()
-            cfg = await self.config.guild(ctx.guild).servers()
-            cfg_lower = {key.lower(): value for (key, value) in cfg.items()}
+            index = await self.get_server_index(cast(discord.Guild, ctx.guild))
+            data = index.get(server)
+            if data is None and server.lower() == "all":
+                await self.show_fleet_status(ctx, index)
+                return
 
-            if server not in cfg_lower:
+            if data is None:
                 await ctx.send("That server does not exist!")
                 return
 
-            data = cfg_lower[server]
             try:
-                fetched_data = await self.get_ss14_server_status(data)
+                fetched_data = await self.get_server_status(data)
+            except StatusUnreachableError as e:
+                return await ctx.send(
+                    f"The server is unreachable since <t:{int(e.since)}:R>."
+                )
+            except StatusTimeoutError:
+                return await ctx.send("The server took too long to respond.")
             except StatusFetchError:
                 return await ctx.send("An error has occured when fetching server info.")
 
@@ -140,11 +558,9 @@ class GameServerStatus(commands.Cog):
         legacy: bool
             Legacy mode, for older Discord clients
         """
-        server_name = server_name.lower()
-        game_servers: dict = await self.config.guild(interaction.guild).servers()
+        game_server_data = (await self.get_server_index(cast(discord.Guild, interaction.guild))).get(server_name)
         visible_command = not await self.config.guild(interaction.guild).slashcommandvisible()
 
-        game_server_data = game_servers.get(server_name)
         if game_server_data is None:
             return await interaction.response.send_message(
                 "That server does not exist!", ephemeral=True
@@ -153,7 +569,15 @@ class GameServerStatus(commands.Cog):
         # Defer here so we can wait for the HTTP status to return
         await interaction.response.defer(thinking=True, ephemeral=visible_command)
         try:
-            fetched_data = await self.get_ss14_server_status(game_server_data)
+            fetched_data = await self.get_server_status(game_server_data)
+        except StatusUnreachableError as e:
+            return await interaction.followup.send(
+                f"The server is unreachable since <t:{int(e.since)}:R>."
+            )
+        except StatusTimeoutError:
+            return await interaction.followup.send(
+                "The server took too long to respond."
+            )
         except StatusFetchError:
             return await interaction.followup.send(
                 "An error has occured when fetching server info."
@@ -180,14 +604,203 @@ class GameServerStatus(commands.Cog):
     async def slash_status_server_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> List[app_commands.Choice[str]]:
-        server_names = list(
-            (await self.config.guild(interaction.guild).servers()).keys()
-        )  # JSON is practically memcached anyhow
-        return [
-            app_commands.Choice(name=server.capitalize(), value=server)
-            for server in server_names
-            if current.lower() in server.lower()
-        ][:25]  # Discord's Choice limit is 25, ensure we don't exceed it
+        index = await self.get_server_index(cast(discord.Guild, interaction.guild))
+        choices = []
+        # Discord's Choice limit is 25, ensure we don't exceed it
+        for server in index.search(current, limit=25):
+            label = server.capitalize()
+            longname = index.servers[server].get("name")
+            if longname:
+                label = f"{label} ({longname})"
+            choices.append(app_commands.Choice(name=label[:100], value=server))
+        return choices
+
+    async def get_server_index(self, guild: discord.Guild) -> ServerIndex:
+        """Returns the server index of a guild, building it from config on first use."""
+        index = self.server_indexes.get(guild.id)
+        if index is None:
+            index = ServerIndex(await self.config.guild(guild).servers())
+            self.server_indexes[guild.id] = index
+        return index
+
+    @commands.command()
+    @commands.guild_only()
+    async def statushistory(
+        self,
+        ctx: commands.Context,
+        server: str,
+        window: HistoryWindow = timedelta(days=7),
+    ) -> None:
+        """Shows the player count history of a game server.
+
+        `<server>`: The server to show.
+        `[window]`: How far to look back, for example `24h`, `7d` or `4w`. Defaults to a week.
+        """
+        data = (await self.get_server_index(cast(discord.Guild, ctx.guild))).get(server)
+        if data is None:
+            await ctx.send("That server does not exist!")
+            return
+
+        # Hourly rows for short windows, daily rows for anything longer.
+        daily = window > timedelta(days=2)
+        end = time.time()
+        rollups = await self.history.query(
+            get_status_key(data), end - window.total_seconds(), end, daily
+        )
+        if not rollups:
+            await ctx.send("No player counts have been recorded for that server yet.")
+            return
+
+        peak = max(rollups, key=lambda r: r.high)
+        samples = sum(r.samples for r in rollups)
+        average = sum(r.average * r.samples for r in rollups) / samples
+        summary = (
+            f"**Peak:** {peak.high} (<t:{peak.start}:{'D' if daily else 'f'}>)\n"
+            f"**Average:** {average:.1f}\n"
+            f"**Low:** {min(r.low for r in rollups)}\n\n"
+        )
+        content = "\n".join(
+            f"<t:{r.start}:{'D' if daily else 'f'}> - {r.low} / {r.average:.0f} / {r.high}"
+            for r in reversed(rollups)
+        )
+
+        pages = list(pagify(content, page_length=1024))
+        embed_pages = []
+        for idx, page in enumerate(pages, start=1):
+            embed = discord.Embed(
+                title=f"Player History: {data.get('name') or server.lower()}",
+                description=summary + "**Min / Avg / Max**\n" + page,
+                colour=await ctx.embed_colour(),
+            )
+            embed.set_footer(
+                text="Last {window} - Page {num}/{total}".format(
+                    window=humanize_timedelta(timedelta=window), num=idx, total=len(pages)
+                )
+            )
+            embed_pages.append(embed)
+        await menus.menu(ctx, embed_pages, menus.DEFAULT_CONTROLS)
+
+    @commands.command()
+    @commands.guild_only()
+    async def statusuptime(
+        self,
+        ctx: commands.Context,
+        server: str,
+        window: UptimeWindow = timedelta(days=30),
+    ) -> None:
+        """Shows the uptime and recent outages of a game server.
+
+        Uptime is the share of status polls the server answered.
+
+        `<server>`: The server to show.
+        `[window]`: How far back to list outages, for example `24h`, `7d` or `4w`. Defaults to 30 days.
+        """
+        data = (await self.get_server_index(cast(discord.Guild, ctx.guild))).get(server)
+        if data is None:
+            await ctx.send("That server does not exist!")
+            return
+
+        key = get_status_key(data)
+        availability = self.uptime.availability(key)
+        if not any(a.polls for a in availability.values()):
+            await ctx.send("That server has not been polled yet.")
+            return
+
+        summary = "\n".join(
+            f"**{name}:** "
+            + (
+                f"{a.uptime:.2%} of {a.polls} polls, avg {a.latency * 1000:.0f}ms"
+                if a.uptime is not None
+                else "no polls"
+            )
+            for name, a in availability.items()
+        )
+        down_since = self.uptime.down_since(key)
+        if down_since is not None:
+            summary += f"\n**Down since** <t:{int(down_since)}:R>"
+
+        outages = await self.uptime.outages(key, time.time() - window.total_seconds())
+        content = "\n".join(
+            f"<t:{int(o.start)}:f> - "
+            + (
+                f"{humanize_timedelta(seconds=int(o.end - o.start)) or 'under a second'}"
+                if o.end is not None
+                else "ongoing"
+            )
+            + f" ({o.error})"
+            for o in outages
+        ) or "None"
+
+        pages = list(pagify(content, page_length=1024))
+        embed_pages = []
+        for idx, page in enumerate(pages, start=1):
+            embed = discord.Embed(
+                title=f"Uptime: {data.get('name') or server.lower()}",
+                description=summary + "\n\n**Outages**\n" + page,
+                colour=await ctx.embed_colour(),
+            )
+            embed.set_footer(
+                text="Outages in the last {window} - Page {num}/{total}".format(
+                    window=humanize_timedelta(timedelta=window), num=idx, total=len(pages)
+                )
+            )
+            embed_pages.append(embed)
+        await menus.menu(ctx, embed_pages, menus.DEFAULT_CONTROLS)
+
+    async def show_fleet_status(self, ctx: commands.Context, index: ServerIndex) -> None:
+        """Fetches every server of a guild at once and pages through them, busiest first."""
+        if len(index) == 0:
+            await ctx.send("No servers are currently configured!")
+            return
+
+        async def fetch(data: Dict[str, str]) -> Optional[Snapshot]:
+            try:
+                return await asyncio.wait_for(
+                    self.fetch_status_snapshot(data), timeout=self.status_timeout.total
+                )
+            except (StatusFetchError, asyncio.TimeoutError):
+                return None
+
+        names = list(index.servers)
+        snapshots = await asyncio.gather(*(fetch(index.servers[name]) for name in names))
+
+        def sort_key(entry: Tuple[str, Optional[Snapshot]]) -> Tuple[bool, int]:
+            players = entry[1].data.get("players") if entry[1] is not None else None
+            return (entry[1] is None, -players if isinstance(players, int) else 0)
+
+        fleet = sorted(zip(names, snapshots), key=sort_key)
+        online = sum(1 for _, snapshot in fleet if snapshot is not None)
+        players = sum(
+            snapshot.data["players"]
+            for _, snapshot in fleet
+            if snapshot is not None and isinstance(snapshot.data.get("players"), int)
+        )
+
+        embed_pages = []
+        pages = [fleet[i : i + FLEET_PAGE_SIZE] for i in range(0, len(fleet), FLEET_PAGE_SIZE)]
+        for idx, page in enumerate(pages, start=1):
+            embed = discord.Embed(
+                title="Server Fleet",
+                description=f"**{players}** players on **{online}/{len(fleet)}** reachable servers.",
+                colour=await ctx.embed_colour(),
+            )
+            for name, snapshot in page:
+                title = index.servers[name].get("name") or name
+                if snapshot is None:
+                    embed.add_field(name=title, value=":x: Unreachable", inline=False)
+                    continue
+
+                fields = render_ss14_status(snapshot.data)
+                embed.add_field(
+                    name=f"{title} - {fields['player_count']}",
+                    value=f"{fields['status']}\n**Map:** {fields['gamemap']} - **Preset:** {fields['preset']}",
+                    inline=False,
+                )
+            embed.set_footer(
+                text="Page {num}/{total}".format(num=idx, total=len(pages))
+            )
+            embed_pages.append(embed)
+        await menus.menu(ctx, embed_pages, menus.DEFAULT_CONTROLS)
 
     async def show_server_list(self, ctx: commands.Context) -> None:
         servers = await self.config.guild(ctx.guild).servers()
@@ -214,46 +827,116 @@ class GameServerStatus(commands.Cog):
             embed_pages.append(embed)
         await menus.menu(ctx, embed_pages, menus.DEFAULT_CONTROLS)
 
-    async def get_ss14_server_status(self, config: Dict[str, str]) -> Dict[str, str]:
-        """Fetches and returns the status endpoint from a SS14 server."""
-        cfgurl = config["address"]
-        longname = config.get("name")  # noqa: F841
-        addr = get_ss14_status_url(cfgurl)
-        log.debug("SS14 addr is {}".format(addr))
+    async def get_server_status(self, config: Dict[str, str]) -> Dict[str, str]:
+        """Fetches the status of a game server and renders it for the status layouts."""
+        snapshot = await self.fetch_status_snapshot(config)
+        return render_ss14_status(snapshot.data, name=get_status_name(config))
+
+    async def fetch_status_snapshot(
+        self, config: Dict[str, str], max_age: Optional[float] = None
+    ) -> Snapshot:
+        """
+        Returns the status snapshot of a game server, going through the status cache.
+
+        `max_age` lowers the cache TTL for this call.
+        """
+        await self.restore_state()
+        key = get_status_key(config)
+        log.debug("Status key is {}".format(key))
+        return await self.status_cache.get(
+            key, lambda: self.query_status(key, config), max_age=max_age
+        )
+
+    async def query_status(self, key: str, config: Dict[str, str]) -> Dict[str, Any]:
+        """Queries a game server directly, returning its status in the SS14 payload shape."""
+        if not self.breaker.allow(key):
+            self.metrics.counters["breaker_rejected"] += 1
+            raise StatusUnreachableError(
+                cast(float, self.breaker.open_since(key)), self.status_cache.peek(key)
+            )
+
+        started = time.perf_counter()
+        try:
+            if config.get("type") == "ss13":
+                json = await self.query_ss13_status(config)
+            elif config.get("type") == "qstat":
+                json = await self.query_udp_status(config)
+            else:
+                json = await self.query_ss14_status(key)
+        except StatusFetchError as e:
+            # Name the underlying failure, StatusFetchError itself says little.
+            cause = e.__context__ if e.__context__ is not None else e
+            self.uptime.record(
+                key, False, time.perf_counter() - started, time.time(), type(cause).__name__
+            )
+            if self.breaker.failure(key):
+                self.metrics.counters["breaker_opened"] += 1
+                log.warning("%s keeps failing, only probing it until it answers again.", key)
+            raise
+        finally:
+            self.metrics.fetch_latency[key].observe(time.perf_counter() - started)
+
+        self.uptime.record(key, True, time.perf_counter() - started, time.time())
+        if self.breaker.success(key):
+            log.info("%s is answering again.", key)
+
+        if isinstance(json.get("players"), int):
+            self.history.record(key, json["players"], time.time())
+
+        return json
 
+    async def query_ss14_status(self, addr: str) -> Dict[str, Any]:
         try:
             log.debug("Starting to query")
-            async with self.session.get(addr + "/status") as resp:
+            async with self.session.get(addr + "/status", timeout=self.status_timeout) as resp:
                 log.debug("Got response.")
                 json = await resp.json()
-        except:
+        except asyncio.TimeoutError as e:
+            self.metrics.error(e)
+            raise StatusTimeoutError
+        except Exception as e:
+            self.metrics.error(e)
             raise StatusFetchError
 
-        count = json.get("players", "?")
-        count_max = json.get("soft_max_players", "?")
-        name = json.get("name", "?")
-        round_id = json.get("round_id", "?")
-        gamemap = json.get("map", "?")
-        preset = json.get("preset", "?")
-        run_level = json.get("run_level")
-        round_start_time = json.get("round_start_time")
-
-        player_count = f"{count}/{count_max}"
-        if run_level == 1 and round_start_time is not None:
-            start_time = dateutil.parser.isoparse(round_start_time)
-            delta = datetime.now(timezone.utc) - start_time
-            status = f"{SS14_RUN_LEVEL_STATUS.get(run_level, 'unknown')} ({humanize_timedelta(timedelta=delta, maximum_units=2)})"
-        else:
-            status = SS14_RUN_LEVEL_STATUS.get(run_level, "Unknown")
+        if not isinstance(json, dict):
+            self.metrics.errors["InvalidPayload"] += 1
+            raise StatusFetchError
 
-        return {
-            "name": name,
-            "player_count": player_count,
-            "status": status,
-            "gamemap": gamemap,
-            "preset": preset,
-            "round_id": round_id,
-        }
+        return json
+
+    async def resolve_host(self, host: str, port: int, family: int) -> str:
+        """Resolves a game server host through the shared caching resolver, to the address to use."""
+        addresses = await self.resolver.resolve(host, port, family=family)
+        return addresses[0]["host"]
+
+    async def query_ss13_status(self, config: Dict[str, str]) -> Dict[str, Any]:
+        try:
+            address, port = get_ss13_status_addr(config["address"])
+            ip = await self.resolve_host(address, port, socket.AF_UNSPEC)
+            response = await self.byond_client.topic(ip, port, b"?status")
+            return parse_ss13_status(response, config["address"])
+        except asyncio.TimeoutError as e:
+            self.metrics.error(e)
+            raise StatusTimeoutError
+        except Exception as e:
+            self.metrics.error(e)
+            raise StatusFetchError
+
+    async def query_udp_status(self, config: Dict[str, str]) -> Dict[str, Any]:
+        try:
+            protocol, default_port = SUPPORTED_QSTAT_TYPES[config["qstat_type"]]
+            address, port = get_udp_status_addr(config["address"], default_port)
+            # The query socket is IPv4 only.
+            ip = await self.resolve_host(address, port, socket.AF_INET)
+            json = await self.udp_engine.query(protocol, ip, port)
+        except asyncio.TimeoutError as e:
+            self.metrics.error(e)
+            raise StatusTimeoutError
+        except Exception as e:
+            self.metrics.error(e)
+            raise StatusFetchError
+
+        return json
 
     @commands.group()
     @checks.admin_or_permissions(manage_guild=True)
@@ -283,18 +966,77 @@ class GameServerStatus(commands.Cog):
         `<address>`: The `ss14://` or `ss14s://` address of this server.
         `[longname]`: The "full name" of this server.
         """
-        name = name.lower()
-        address = address.rstrip("/")
+        await self.add_server(
+            ctx, name, {"type": "ss14", "address": address.rstrip("/"), "name": longname}
+        )
+
+    @addserver.command(name="ss13")
+    async def addserver_ss13(
+        self, ctx: commands.Context, name: str, address: str, longname: Optional[str]
+    ) -> None:
+        """
+        Adds an SS13-type server.
+
+        `<name>`: The short name to refer to this server.
+        `<address>`: The `byond://` address of this server, including the port.
+        `[longname]`: The "full name" of this server.
+        """
+        try:
+            get_ss13_status_addr(address)
+        except ValueError:
+            await ctx.send("The address needs a port, like `byond://example.com:1337`.")
+            return
+
+        await self.add_server(
+            ctx, name, {"type": "ss13", "address": address.rstrip("/"), "name": longname}
+        )
+
+    @addserver.command(name="qstat")
+    async def addserver_qstat(
+        self,
+        ctx: commands.Context,
+        qstat_type: str,
+        name: str,
+        address: str,
+        longname: Optional[str],
+    ) -> None:
+        """
+        Adds a server queried over UDP, using QStat's server type names.
 
+        `<qstat_type>`: The QStat type of this server, like `a2s` or `q3s`.
+        `<name>`: The short name to refer to this server.
+        `<address>`: The `host:port` address of this server. The port defaults to the usual one for the type.
+        `[longname]`: The "full name" of this server.
+        """
+        qstat_type = qstat_type.lower()
+        if qstat_type not in SUPPORTED_QSTAT_TYPES:
+            supported = ", ".join(
+                f"`{t}` ({QSTAT_TYPES.get(t, t)})" for t in SUPPORTED_QSTAT_TYPES
+            )
+            await ctx.send(f"Unsupported server type. Supported types are: {supported}.")
+            return
+
+        await self.add_server(
+            ctx,
+            name,
+            {
+                "type": "qstat",
+                "qstat_type": qstat_type,
+                "address": address.rstrip("/"),
+                "name": longname,
+            },
+        )
+
+    async def add_server(
+        self, ctx: commands.Context, name: str, data: Dict[str, Any]
+    ) -> None:
+        name = name.lower()
         async with self.config.guild(ctx.guild).servers() as cur_servers:
             if name in cur_servers:
                 return await ctx.send("A server with that name already exists.")
 
-            cur_servers[name] = {
-                "type": "ss14",
-                "address": address,
-                "name": longname,
-            }
+            cur_servers[name] = data
+        self.server_indexes.pop(cast(discord.Guild, ctx.guild).id, None)
         await ctx.tick()
 
     @statuscfg.command()
@@ -311,15 +1053,66 @@ class GameServerStatus(commands.Cog):
                 return
 
             del cur_servers[name]
+        self.server_indexes.pop(cast(discord.Guild, ctx.guild).id, None)
 
         async with self.config.guild(ctx.guild).watches() as watches:
             for w in watches:
-                if w["server"] != name:
-                    continue
+                if name in w.get("servers", ()):
+                    w["servers"].remove(name)
 
-                watches.remove(w)
-                await self.remove_watch_message(ctx.guild, w)
+            # Panels go away with their last server.
+            removed = remove_list_elems(
+                watches, lambda w: w.get("server") == name or w.get("servers") == []
+            )
+            for w in removed:
+                await self.remove_watch_message(cast(discord.Guild, ctx.guild), w)
 
+        async with self.config.guild(ctx.guild).event_routes() as routes:
+            remove_list_elems(routes, lambda r: r["server"] == name)
+
+        self.watch_table = None
+        await ctx.tick()
+
+    @statuscfg.command()
+    async def pollinterval(
+        self,
+        ctx: commands.Context,
+        name: str,
+        floor: Optional[float] = None,
+        ceiling: Optional[float] = None,
+    ) -> None:
+        """
+        Limits how often a watched server is polled.
+
+        Servers are polled more often around round start and end, and less often mid-round.
+        Leave out both limits to go back to the defaults.
+
+        `<name>`: The name of the server.
+        `[floor]`: The minimum number of seconds between two polls.
+        `[ceiling]`: The maximum number of seconds between two polls.
+        """
+        name = name.lower()
+        for limit in (floor, ceiling):
+            if limit is not None and not POLL_INTERVAL_MIN <= limit <= POLL_INTERVAL_MAX:
+                await ctx.send(
+                    f"Poll intervals must be between {POLL_INTERVAL_MIN:g} and {POLL_INTERVAL_MAX:g} seconds."
+                )
+                return
+
+        if floor is not None and ceiling is not None and floor > ceiling:
+            await ctx.send("The floor can't be higher than the ceiling.")
+            return
+
+        async with self.config.guild(ctx.guild).servers() as cur_servers:
+            if name not in cur_servers:
+                await ctx.send("That server does not exist!")
+                return
+
+            cur_servers[name]["poll_floor"] = floor
+            cur_servers[name]["poll_ceiling"] = ceiling
+
+        self.server_indexes.pop(cast(discord.Guild, ctx.guild).id, None)
+        self.watch_table = None
         await ctx.tick()
 
     @statuscfg.command()
@@ -327,7 +1120,7 @@ class GameServerStatus(commands.Cog):
         self, ctx: commands.Context, name: str, channel: TextChannel
     ) -> None:
         """
-        Adds a server to the watch list. The bot will update a message with the server status every minute.
+        Adds a server to the watch list. The bot will keep a message updated with the server status.
 
         `<name>`: The name of the server to watch.
         `<channel>`: The channel to send the message to.
@@ -342,7 +1135,7 @@ class GameServerStatus(commands.Cog):
 
             data = servers[name]
 
-            fetched_data = await self.get_ss14_server_status(data)
+            fetched_data = await self.get_server_status(data)
             component_view = SS14ServerStatus(
                 **fetched_data, color=await self.bot.get_embed_color(ctx.channel)
             )
@@ -350,7 +1143,85 @@ class GameServerStatus(commands.Cog):
             msg = await channel.send(view=component_view)
             watches.append({"message": msg.id, "server": name, "channel": channel.id})
 
-            return await ctx.send("The server watch is successfully added.")
+        self.watch_table = None
+        return await ctx.send("The server watch is successfully added.")
+
+    @statuscfg.command()
+    async def addpanel(
+        self, ctx: commands.Context, channel: TextChannel, *names: str
+    ) -> None:
+        """
+        Adds a panel to the watch list. The bot will keep one message updated with the status of several servers.
+
+        Panels with more than 10 servers are split over several messages.
+
+        `<channel>`: The channel to send the panel to.
+        `<names...>`: The names of the servers to show, in order.
+        """
+        names = tuple(dict.fromkeys(name.lower() for name in names))
+        if not names:
+            await ctx.send_help()
+            return
+
+        servers = await self.config.guild(ctx.guild).servers()
+        missing = [name for name in names if name not in servers]
+        if missing:
+            await ctx.send(f"These servers do not exist: {', '.join(missing)}")
+            return
+
+        async def fetch(name: str) -> Tuple[str, Optional[Dict[str, str]]]:
+            try:
+                snapshot = await self.fetch_status_snapshot(servers[name])
+            except StatusFetchError:
+                return servers[name].get("name") or name, None
+            return name, render_ss14_status(snapshot.data, name=get_status_name(servers[name]))
+
+        color = await self.bot.get_embed_color(channel)
+        entries = await asyncio.gather(*(fetch(name) for name in names))
+
+        async with self.config.guild(ctx.guild).watches() as watches:
+            for start in range(0, len(names), PANEL_MAX_SERVERS):
+                view = SS14StatusPanel(
+                    entries=list(entries[start : start + PANEL_MAX_SERVERS]), color=color
+                )
+                msg = await channel.send(view=view)
+                watches.append(
+                    {
+                        "message": msg.id,
+                        "servers": list(names[start : start + PANEL_MAX_SERVERS]),
+                        "channel": channel.id,
+                    }
+                )
+
+        self.watch_table = None
+        await ctx.send("The server panel is successfully added.")
+
+    @statuscfg.command()
+    async def rempanel(
+        self, ctx: commands.Context, channel: TextChannel, message_id: int
+    ) -> None:
+        """
+        Removes a panel from the watch list.
+
+        `<channel>`: The channel the panel is in.
+        `<message_id>`: The ID of the panel message.
+        """
+        async with self.config.guild(ctx.guild).watches() as watches:
+            removed = remove_list_elems(
+                watches,
+                lambda w: "servers" in w
+                and w["channel"] == channel.id
+                and w["message"] == message_id,
+            )
+            for w in removed:
+                await self.remove_watch_message(cast(discord.Guild, ctx.guild), w)
+
+        if not removed:
+            await ctx.send("That message is not a panel in that channel.")
+            return
+
+        self.watch_table = None
+        await ctx.tick()
 
     @statuscfg.command()
     async def remwatch(
@@ -364,13 +1235,13 @@ class GameServerStatus(commands.Cog):
         """
         name = name.lower()
         async with self.config.guild(ctx.guild).watches() as watches:
-            for w in watches:
-                if w["server"] != name or w["channel"] != channel.id:
-                    continue
-
-                watches.remove(w)
-                await self.remove_watch_message(ctx.guild, w)
+            removed = remove_list_elems(
+                watches, lambda w: w.get("server") == name and w["channel"] == channel.id
+            )
+            for w in removed:
+                await self.remove_watch_message(cast(discord.Guild, ctx.guild), w)
 
+        self.watch_table = None
         await ctx.tick()
 
     async def remove_watch_message(
@@ -397,7 +1268,7 @@ class GameServerStatus(commands.Cog):
 
         content = "\n".join(
             map(
-                lambda w: f"<#{w['channel']}> - {w['server']} - [message](https://discord.com/channels/{ctx.guild.id}/{w['channel']}/{w['message']})",
+                lambda w: f"<#{w['channel']}> - {w.get('server') or ', '.join(w['servers'])} - [message](https://discord.com/channels/{cast(discord.Guild, ctx.guild).id}/{w['channel']}/{w['message']})",
                 watches,
             )
         )
@@ -416,51 +1287,695 @@ class GameServerStatus(commands.Cog):
             embed_pages.append(embed)
         await menus.menu(ctx, embed_pages, menus.DEFAULT_CONTROLS)
 
-    @tasks.loop(minutes=1)
+    @tasks.loop(seconds=1)
     async def printer(self) -> None:
-        log.debug("Starting watcher loop.")
         try:
-            for guild_id, data in (await self.config.all_guilds()).items():
-                for watch in data["watches"]:
-                    msg_id = watch["message"]
-                    ch_id = watch["channel"]
-                    server = watch["server"]
-
-                    try:
-                        channel = self.bot.get_channel(ch_id)
-                        msg = await channel.fetch_message(msg_id)
-                    except discord.NotFound:
-                        # Message gone now, clear config I guess.
-                        async with self.config.guild_from_id(
-                            guild_id
-                        ).watches() as w_config:
-                            remove_list_elems(
-                                w_config, lambda x: x["message"] == msg_id
-                            )
-                        continue
+            started = time.monotonic()
+            # Edits that hit a deleted message since the last tick.
+            await self.prune_dead_watches()
+
+            now = time.monotonic()
+            if self.warming_up is None:
+                await self.warm_start()
+            elif self.watch_table is None or now - self.watch_table_refreshed > WATCH_TABLE_REFRESH:
+                await self.refresh_watch_table()
+
+            if now - self.history_flushed > HISTORY_FLUSH_INTERVAL:
+                self.history_flushed = now
+                await self.history.flush()
+                await self.uptime.flush()
+
+            watch_table = self.watch_table
+            if watch_table is None:
+                return
 
-                    try:
-                        fetched_data = await self.get_ss14_server_status(
-                            data["servers"][server]
-                        )
-                    except StatusFetchError:
-                        continue  # End the function early just because we can't fetch the status
-                    view = SS14ServerStatus(
-                        **fetched_data, color=await self.bot.get_embed_color(msg)
-                    )
-                    await msg.edit(
-                        content="", embed=None, view=view
-                    )  # Ensure backwards compatability with old watches
-        except discord.errors.HTTPException as e:
-            log.exception(
-                "Error happened while trying to execute gameserverstatus loop.",
-                exc_info=e,
-            )
+            # Polls run on their own, a server that never answers only holds up itself.
+            now = time.monotonic()
+            polled = False
+            for key, when in self.poll_scheduler.pop_due(now):
+                group = watch_table.get(key)
+                if group is None:
+                    continue
+                if key in self.poll_tasks:
+                    # Still busy with the last poll, which reschedules it once it has fetched.
+                    self.poll_scheduler.schedule(key, now + POLL_INTERVAL_MIN)
+                    continue
+
+                self.metrics.loop_lag.observe(now - when)
+                self.start_poll(key, group)
+                polled = True
+            if polled:
+                self.metrics.loop_duration.observe(time.monotonic() - started)
         except Exception as e:
+            self.metrics.error(e)
             log.exception(
                 "An unexpected error occurred in the printer loop.", exc_info=e
             )
 
+    async def warm_start(self) -> None:
+        """
+        Fetches every watched server at once to fill the status cache, then spreads the
+        first polls over `watch_warmup_window` seconds instead of doing them all in one tick.
+
+        Servers that answered come online first, poll_server shows what was fetched here.
+        Servers with a poll time saved by the last unload keep it and are left out.
+        """
+        await self.restore_state()
+        restored = set(self.poll_scheduler.keys())
+        await self.refresh_watch_table()
+        watch_table = cast(Dict[str, Dict[str, Any]], self.watch_table)
+        table = {key: group for key, group in watch_table.items() if key not in restored}
+        settings = await self.config.all()
+        self.warming_up = {
+            watch["message"] for group in watch_table.values() for _, watch in group["watches"]
+        }
+
+        async def warm(group: Dict[str, Any]) -> None:
+            async with self.get_host_semaphore(group["server"]), self.poll_semaphore:
+                await self.fetch_status_snapshot(group["server"])
+
+        jobs = {asyncio.create_task(warm(group)): key for key, group in table.items()}
+
+        warmed = []
+        if jobs:
+            done, pending = await asyncio.wait(jobs, timeout=settings["watch_deadline"])
+            for job in pending:
+                job.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            for job in done:
+                if job.exception() is None:
+                    warmed.append(jobs[job])
+                elif not isinstance(job.exception(), StatusFetchError):
+                    self.metrics.error(cast(BaseException, job.exception()))
+                    log.error(
+                        "Error happened while warming up the status cache.",
+                        exc_info=job.exception(),
+                    )
+
+        warmed_keys = set(warmed)
+        order = warmed + [key for key in table if key not in warmed_keys]
+        window = settings["watch_warmup_window"]
+        now = time.monotonic()
+        for i, key in enumerate(order):
+            self.poll_scheduler.schedule(key, now + window * i / len(order))
+
+        log.info(
+            "Warmed up the status cache for %d of %d servers %.1fs after startup, spreading "
+            "their first polls over %.0fs. %d servers kept their poll times from before the reload.",
+            len(warmed),
+            len(table),
+            now - self.started,
+            window,
+            len(watch_table) - len(table),
+        )
+
+    async def restore_state(self) -> None:
+        """Loads the state saved by the last unload, once, the first time anything needs it."""
+        if self.state_restore is None:
+            self.state_restore = asyncio.ensure_future(self.load_state())
+        if not self.state_restore.done():
+            await asyncio.shield(self.state_restore)
+
+    async def load_state(self) -> None:
+        try:
+            state = await self.state_file.load(STATE_MAX_AGE)
+        except Exception as e:
+            log.error("Could not load the saved status cache.", exc_info=e)
+            return
+        if state is None:
+            return
+
+        now = time.time()
+        elapsed = now - state["saved_at"]
+        restored = 0
+        for key, (data, fetched_at) in state["snapshots"].items():
+            if now - fetched_at <= STATE_MAX_AGE and self.status_cache.peek(key) is None:
+                self.status_cache.put(key, Snapshot(data, fetched_at))
+                restored += 1
+
+        self.breaker.restore(state["circuits"], elapsed)
+        monotonic_now = time.monotonic()
+        for key, due_in in state["schedule"].items():
+            if key not in self.poll_scheduler:
+                self.poll_scheduler.schedule(key, monotonic_now + due_in - elapsed)
+
+        log.info(
+            "Restored %d status snapshots, %d failing servers and %d poll times saved %.0fs ago.",
+            restored,
+            len(state["circuits"]),
+            len(state["schedule"]),
+            elapsed,
+        )
+
+    async def save_state(self) -> None:
+        # Nothing may have needed the old state yet, keep what is still good of it.
+        await self.restore_state()
+        now = time.monotonic()
+        await self.state_file.save(
+            {
+                "snapshots": {
+                    key: [snapshot.data, snapshot.fetched_at]
+                    for key, snapshot in self.status_cache.items()
+                },
+                "circuits": self.breaker.dump(),
+                "schedule": {
+                    key: cast(float, self.poll_scheduler.due_at(key)) - now
+                    for key in self.poll_scheduler.keys()
+                },
+            }
+        )
+
+    def get_host_semaphore(self, server: Dict[str, Any]) -> asyncio.Semaphore:
+        host = get_status_host(server)
+        semaphore = self.host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self.host_semaphores[host] = asyncio.Semaphore(self.watch_host_concurrency)
+        return semaphore
+
+    def start_poll(self, key: str, group: Dict[str, Any]) -> None:
+        task = asyncio.create_task(self.run_poll(key, group))
+        self.poll_tasks[key] = task
+        task.add_done_callback(functools.partial(self.poll_done, key))
+
+    def poll_done(self, key: str, task: "asyncio.Task[None]") -> None:
+        if self.poll_tasks.get(key) is task:
+            del self.poll_tasks[key]
+
+    async def run_poll(self, key: str, group: Dict[str, Any]) -> None:
+        """Polls a single due server, giving up on it after `watch_deadline` seconds."""
+        started = time.monotonic()
+        try:
+            results = await asyncio.wait_for(
+                self.poll_server(key, group, self.get_host_semaphore(group["server"])),
+                timeout=self.watch_deadline,
+            )
+        except asyncio.TimeoutError:
+            self.metrics.counters["polls_abandoned"] += 1
+            log.warning(
+                "Polling %s hit the %ss deadline and was abandoned.", key, self.watch_deadline
+            )
+            return
+        except Exception as e:
+            self.metrics.error(e)
+            log.error("Error happened while trying to execute gameserverstatus loop.", exc_info=e)
+            return
+        finally:
+            self.metrics.poll_duration.observe(time.monotonic() - started)
+
+        skipped = 0
+        for result in results:
+            if isinstance(result, Exception):
+                self.metrics.error(result)
+                log.error(
+                    "Error happened while trying to execute gameserverstatus loop.",
+                    exc_info=result,
+                )
+            elif result is False:
+                skipped += 1
+        self.metrics.counters["edits_skipped"] += skipped
+
+    async def refresh_watch_table(self) -> None:
+        """
+        Regroups every configured watch by the status URL it shows and brings the
+        poll scheduler in line with it.
+        """
+        table: Dict[str, Dict[str, Any]] = {}
+        for guild_id, data in (await self.config.all_guilds()).items():
+            # Servers with event routes are polled like watched ones, with nothing to edit.
+            entries = []
+            for watch in data["watches"]:
+                if "servers" not in watch:
+                    entries.append(("watches", watch["server"], watch))
+                    continue
+
+                # Panels are rendered again whenever any of their servers is polled.
+                panel = [
+                    (
+                        data["servers"][name].get("name") or name,
+                        get_status_key(data["servers"][name]),
+                        get_status_name(data["servers"][name]),
+                    )
+                    for name in watch["servers"]
+                    if name in data["servers"]
+                ]
+                panel_watch = dict(watch, panel=panel)
+                entries.extend(("watches", name, panel_watch) for name in watch["servers"])
+            entries += [("routes", route["server"], route) for route in data.get("event_routes", [])]
+            for kind, name, entry in entries:
+                server = data["servers"].get(name)
+                if server is None:
+                    continue
+
+                key = get_status_key(server)
+                if key not in table:
+                    table[key] = {
+                        "server": server,
+                        "watches": [],
+                        "routes": [],
+                        "floor": None,
+                        "ceiling": None,
+                    }
+                group = table[key]
+                # Snapshots are shared between guilds, each renders them with its own long name.
+                group[kind].append((guild_id, dict(entry, longname=get_status_name(server))))
+
+                # The same server can be configured by several guilds, the most
+                # demanding limits win. The ceiling beats the floor if they clash.
+                floor = server.get("poll_floor")
+                if floor is not None and (group["floor"] is None or floor > group["floor"]):
+                    group["floor"] = floor
+                ceiling = server.get("poll_ceiling")
+                if ceiling is not None and (group["ceiling"] is None or ceiling < group["ceiling"]):
+                    group["ceiling"] = ceiling
+
+        for key in self.poll_scheduler.keys():
+            if key not in table:
+                self.poll_scheduler.discard(key)
+        for key in list(self.event_snapshots):
+            if key not in table:
+                del self.event_snapshots[key]
+
+        watched = {watch["message"] for group in table.values() for _, watch in group["watches"]}
+        for msg_id in self.edit_outbox.message_ids():
+            if msg_id not in watched:
+                self.edit_outbox.discard(msg_id)
+        for msg_id in list(self.watch_views):
+            if msg_id not in watched:
+                del self.watch_views[msg_id]
+        for msg_id in list(self.watch_fingerprints):
+            if msg_id not in watched:
+                del self.watch_fingerprints[msg_id]
+
+        now = time.monotonic()
+        for key in table:
+            if key not in self.poll_scheduler:
+                self.poll_scheduler.schedule(key, now)
+
+        self.watch_table = table
+        self.watch_table_refreshed = now
+
+    async def poll_server(
+        self,
+        key: str,
+        group: Dict[str, Any],
+        host_semaphore: asyncio.Semaphore,
+    ) -> List[Any]:
+        """
+        Fetches a watched server once, schedules its next poll and renders it
+        into every watch showing it.
+
+        Returns the result of `update_watch` (or the exception it raised) for each watch.
+        """
+        snapshot = None
+        stale = None
+        try:
+            if key not in self.event_snapshots:
+                # First poll of this server, warm_start may have fetched it a moment ago.
+                snapshot = self.status_cache.peek(key)
+                if snapshot is not None and time.time() - snapshot.fetched_at > WARMUP_REUSE_AGE:
+                    snapshot = None
+            if snapshot is None:
+                async with host_semaphore, self.poll_semaphore:
+                    # Only reuse a cached status if someone fetched it just now.
+                    snapshot = await self.fetch_status_snapshot(
+                        group["server"], max_age=POLL_INTERVAL_MIN
+                    )
+        except StatusFetchError as e:
+            if isinstance(e, StatusUnreachableError):
+                # Still a poll the server failed, or uptime would only count the probes.
+                self.uptime.record(key, False, None, time.time(), "CircuitOpen")
+            # Once the circuit is open, show the last known status. render_watch_status marks it as stale.
+            if self.breaker.open_since(key) is not None:
+                stale = self.status_cache.peek(key)
+            if stale is None:
+                return []
+        finally:
+            run_level = snapshot.data.get("run_level") if snapshot is not None else None
+            self.poll_scheduler.schedule(
+                key,
+                time.monotonic()
+                + next_poll_interval(run_level, group["floor"], group["ceiling"]),
+            )
+
+        if snapshot is None:
+            snapshot = cast(Snapshot, stale)
+        else:
+            previous = self.event_snapshots.get(key)
+            self.event_snapshots[key] = snapshot.data
+            if previous is not None and group["routes"]:
+                events = diff_status(previous, snapshot.data)
+                if events:
+                    # A rate limited announce channel must not hold up the watches.
+                    task = asyncio.create_task(self.dispatch_events(group["routes"], events, snapshot))
+                    self.event_tasks.add(task)
+                    task.add_done_callback(self.event_done)
+
+        return await asyncio.gather(
+            *(
+                self.update_watch(guild_id, watch, key, snapshot)
+                for guild_id, watch in group["watches"]
+            ),
+            return_exceptions=True,
+        )
+
+    async def dispatch_events(
+        self,
+        routes: List[Tuple[int, Dict[str, Any]]],
+        events: List[StatusEvent],
+        snapshot: Snapshot,
+    ) -> None:
+        """Announces status events of a server in every channel they are routed to."""
+        for guild_id, route in routes:
+            lines = []
+            for event in events:
+                threshold = None
+                if event.kind == "players":
+                    threshold = crossed_threshold(event, route.get("thresholds", []))
+                    if threshold is None:
+                        continue
+                lines.append(
+                    render_status_event(snapshot.data, event, threshold, name=route["longname"])
+                )
+
+            channel = self.bot.get_channel(route["channel"])
+            if not lines or not isinstance(channel, discord.abc.Messageable):
+                continue
+
+            self.metrics.counters["events_sent"] += 1
+            try:
+                await channel.send(
+                    "\n".join(lines), allowed_mentions=discord.AllowedMentions.none()
+                )
+            except discord.HTTPException as e:
+                self.metrics.error(e)
+                log.warning(
+                    "Could not send status events to channel %d in guild %d.",
+                    route["channel"],
+                    guild_id,
+                    exc_info=e,
+                )
+
+    def event_done(self, task: "asyncio.Task[None]") -> None:
+        self.event_tasks.discard(task)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self.metrics.error(cast(BaseException, task.exception()))
+            log.error(
+                "Error happened while trying to announce status events.",
+                exc_info=task.exception(),
+            )
+
+    async def update_watch(
+        self,
+        guild_id: int,
+        watch: Dict[str, Any],
+        key: str,
+        snapshot: Snapshot,
+    ) -> Optional[bool]:
+        """
+        Renders a status snapshot for a single watch message and queues the edit for
+        the message's edit slot. A newer render replaces one that is still waiting.
+
+        Returns `True` if an edit was queued, `False` if the status was unchanged
+        since the last edit and `None` if the watch could not be updated.
+        """
+        msg_id = watch["message"]
+        channel = await self.get_watch_channel(guild_id, watch)
+        if channel is None:
+            return None
+
+        color = await self.bot.get_embed_color(channel)
+        if "panel" in watch:
+            # The other servers of the panel are shown as last polled.
+            entries = []
+            for label, panel_key, longname in watch["panel"]:
+                latest = self.status_cache.peek(panel_key)
+                entries.append(
+                    (
+                        label,
+                        self.render_watch_status(panel_key, latest.data, longname)
+                        if latest is not None
+                        else None,
+                    )
+                )
+            fingerprint = hash(
+                (color.value, *(label if f is None else tuple(f.values()) for label, f in entries))
+            )
+        else:
+            fetched_data = self.render_watch_status(key, snapshot.data, watch["longname"])
+            fingerprint = hash((color.value, *fetched_data.values()))
+
+        # What the message will show once an edit in flight has landed.
+        shown = self.edits_in_flight.get(msg_id, self.watch_fingerprints.get(msg_id))
+        if shown == fingerprint:
+            # Back to what the message shows, a waiting edit would be a no-op.
+            self.edit_outbox.discard(msg_id)
+            return False
+
+        pending = self.edit_outbox.get(msg_id)
+        if pending is not None and pending[3] == fingerprint:
+            return False
+
+        # A render still waiting in the outbox holds the same view and goes out with this one.
+        view = self.watch_views.get(msg_id)
+        if "panel" in watch:
+            if isinstance(view, SS14StatusPanel):
+                view.update(entries=entries, color=color)
+            else:
+                view = self.watch_views[msg_id] = SS14StatusPanel(entries=entries, color=color)
+        elif isinstance(view, SS14ServerStatus):
+            view.update(**fetched_data, color=color)
+        else:
+            view = self.watch_views[msg_id] = SS14ServerStatus(**fetched_data, color=color)
+        if self.warming_up and msg_id in self.warming_up:
+            # The warm-up already spread the first polls, don't hold the first edit back too.
+            when = time.time()
+        else:
+            when = edit_slot_time(msg_id, self.watch_edit_window, time.time())
+        self.edit_outbox.put(msg_id, (guild_id, watch, view, fingerprint), when)
+        return True
+
+    def render_watch_status(
+        self, key: str, json: Dict[str, Any], name: Optional[str]
+    ) -> Dict[str, str]:
+        """Renders a status for a watch, marking it as stale while the server's circuit is open."""
+        fields = render_ss14_status(json, granularity=self.watch_time_granularity, name=name)
+        since = self.breaker.open_since(key)
+        if since is not None:
+            fields["status"] = f"Unreachable since <t:{int(since)}:R>"
+        return fields
+
+    async def drain_edits(self) -> None:
+        """
+        Sends the watch edits in the outbox as their slots come up, at most
+        `watch_edit_rate` per second and `watch_concurrency` at once.
+        """
+        next_start = time.monotonic()
+        while True:
+            try:
+                msg_id, pending, age = await self.edit_outbox.take()
+                if msg_id in self.edits_in_flight:
+                    # Let the older edit land first so it can't overwrite this one.
+                    self.edit_outbox.put(msg_id, pending, time.time() + EDIT_RETRY_DELAY)
+                    await asyncio.sleep(0)
+                    continue
+
+                now = time.monotonic()
+                if next_start > now:
+                    await asyncio.sleep(next_start - now)
+                next_start = max(now, next_start) + 1 / self.watch_edit_rate
+
+                # A newer render may have come in while this one waited for the budget.
+                newer = self.edit_outbox.get(msg_id)
+                if newer is not None:
+                    self.edit_outbox.discard(msg_id)
+                    self.metrics.counters["edits_replaced"] += 1
+                    pending = newer
+
+                # Tuning can swap the semaphore out, release the one that was acquired.
+                semaphore = self.edit_semaphore
+                await semaphore.acquire()
+                self.edits_in_flight[msg_id] = pending[3]
+                self.metrics.edit_age.observe(age)
+                task = asyncio.create_task(self.edit_watch(msg_id, pending))
+                task.add_done_callback(functools.partial(self.edit_done, semaphore))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.metrics.error(e)
+                log.exception("An unexpected error occurred in the edit worker.", exc_info=e)
+
+    def edit_done(
+        self, semaphore: asyncio.Semaphore, task: "asyncio.Task[Optional[bool]]"
+    ) -> None:
+        semaphore.release()
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            self.metrics.error(cast(BaseException, task.exception()))
+            log.error(
+                "Error happened while trying to edit a watch message.",
+                exc_info=task.exception(),
+            )
+
+    async def edit_watch(
+        self, msg_id: int, pending: Tuple[int, Dict[str, Any], discord.ui.LayoutView, int]
+    ) -> Optional[bool]:
+        """
+        Sends a render taken out of the edit outbox to its watch message.
+
+        Returns `True` if the message was edited and `None` if the message is gone.
+        """
+        guild_id, watch, view, fingerprint = pending
+        try:
+            channel = await self.get_watch_channel(guild_id, watch)
+            if channel is None:
+                return None
+
+            try:
+                if self.watch_partial_messages:
+                    # Saves a round-trip, a missing message shows up as an error on the edit instead.
+                    msg = channel.get_partial_message(msg_id)
+                else:
+                    self.metrics.counters["discord_fetches"] += 1
+                    msg = await channel.fetch_message(msg_id)
+
+                self.metrics.counters["discord_edits"] += 1
+                await msg.edit(
+                    content="", embed=None, view=view
+                )  # Ensure backwards compatability with old watches
+            except (discord.NotFound, discord.Forbidden) as e:
+                self.metrics.error(e)
+                # Message gone now, clear config I guess.
+                await self.prune_watch(guild_id, msg_id)
+                return None
+            except Exception:
+                # No telling what the message shows now, let the next render go out.
+                self.watch_fingerprints.pop(msg_id, None)
+                raise
+
+            self.watch_fingerprints[msg_id] = fingerprint
+            if self.warming_up and msg_id in self.warming_up:
+                self.warming_up.discard(msg_id)
+                elapsed = time.monotonic() - self.started
+                log.debug("Watch %d first updated %.1fs after startup.", msg_id, elapsed)
+                if not self.warming_up:
+                    log.info("Every watch has been updated, %.1fs after startup.", elapsed)
+            return True
+        finally:
+            self.edits_in_flight.pop(msg_id, None)
+
+    async def get_watch_channel(self, guild_id: int, watch: Dict[str, Any]) -> Any:
+        """Returns the channel of a watch, or None after pruning the watch if the channel is gone."""
+        channel = self.bot.get_channel(watch["channel"])
+        if channel is None:
+            # The channel cache is only incomplete until the bot is ready.
+            await self.bot.wait_until_ready()
+            channel = self.bot.get_channel(watch["channel"])
+            if channel is None:
+                await self.prune_watch(guild_id, watch["message"])
+        return channel
+
+    async def prune_watch(self, guild_id: int, msg_id: int) -> None:
+        """Marks a watch as dead, it is removed from the config by prune_dead_watches."""
+        self.watch_fingerprints.pop(msg_id, None)
+        self.watch_views.pop(msg_id, None)
+        self.edit_outbox.discard(msg_id)
+        if self.warming_up:
+            self.warming_up.discard(msg_id)
+        self.dead_watches.setdefault(guild_id, set()).add(msg_id)
+
+    async def prune_dead_watches(self) -> None:
+        """Removes every watch marked dead, with one config write per guild."""
+        if not self.dead_watches:
+            return
+
+        dead_watches, self.dead_watches = self.dead_watches, {}
+        for guild_id, msg_ids in dead_watches.items():
+            async with self.config.guild_from_id(guild_id).watches() as w_config:
+                removed = remove_list_elems(w_config, lambda x: x["message"] in msg_ids)
+            log.info("Pruned %d dead watches from guild %d.", len(removed), guild_id)
+
+        self.watch_table = None
+
+    @statuscfg.group()
+    async def events(self, ctx: commands.Context) -> None:
+        """
+        Announces round changes of a server in a channel.
+
+        Events come from the watcher's regular polls, so they can lag behind the server by a poll interval.
+        """
+        pass
+
+    @events.command(name="add")
+    async def events_add(
+        self, ctx: commands.Context, name: str, channel: TextChannel, *thresholds: int
+    ) -> None:
+        """
+        Announces new rounds and run level changes of a server in a channel.
+
+        `<name>`: The name of the server.
+        `<channel>`: The channel to announce in.
+        `[thresholds]`: Player counts to announce when the server goes over or under them.
+        """
+        name = name.lower()
+        if name not in await self.config.guild(ctx.guild).servers():
+            await ctx.send("That server does not exist!")
+            return
+
+        route = {"server": name, "channel": channel.id, "thresholds": sorted(set(thresholds))}
+        async with self.config.guild(ctx.guild).event_routes() as routes:
+            remove_list_elems(
+                routes, lambda r: r["server"] == name and r["channel"] == channel.id
+            )
+            routes.append(route)
+
+        self.watch_table = None
+        await ctx.tick()
+
+    @events.command(name="remove")
+    async def events_remove(
+        self, ctx: commands.Context, name: str, channel: TextChannel
+    ) -> None:
+        """
+        Stops announcing the events of a server in a channel.
+
+        `<name>`: The name of the server.
+        `<channel>`: The channel to stop announcing in.
+        """
+        name = name.lower()
+        async with self.config.guild(ctx.guild).event_routes() as routes:
+            removed = remove_list_elems(
+                routes, lambda r: r["server"] == name and r["channel"] == channel.id
+            )
+
+        if not removed:
+            await ctx.send("Events of that server are not announced in that channel.")
+            return
+
+        self.watch_table = None
+        await ctx.tick()
+
+    @events.command(name="list")
+    async def events_list(self, ctx: commands.Context) -> None:
+        """
+        Lists where server events are announced.
+        """
+        routes = await self.config.guild(ctx.guild).event_routes()
+        if not routes:
+            await ctx.send("No event announcements are currently configured!")
+            return
+
+        lines = []
+        for route in routes:
+            thresholds = ", ".join(map(str, route["thresholds"])) or "none"
+            lines.append(f"<#{route['channel']}> - {route['server']} - player thresholds: {thresholds}")
+
+        for page in pagify("\n".join(lines)):
+            await ctx.send(page)
+
     @statuscfg.command()
     async def slashcommandvisible(self, ctx: commands.Context, enabled: bool = None):
         """
@@ -478,8 +1993,214 @@ class GameServerStatus(commands.Cog):
         await ctx.tick()
 
 
+    @statuscfg.group()
+    @checks.is_owner()
+    async def tuning(self, ctx: commands.Context) -> None:
+        """
+        Bot-wide performance settings for the status watcher.
+        """
+        pass
+
+    @tuning.command(name="show")
+    async def tuning_show(self, ctx: commands.Context) -> None:
+        """
+        Shows the current value of every tuning setting.
+        """
+        settings = await self.config.all()
+        content = "\n".join(
+            f"`{key}`: {settings[key]} - {description}"
+            for key, (_, _, _, description) in TUNABLES.items()
+        )
+        for page in pagify(content):
+            await ctx.send(page)
+
+    @tuning.command(name="set")
+    async def tuning_set(self, ctx: commands.Context, key: str, value: str) -> None:
+        """
+        Changes a tuning setting.
+
+        `<key>`: The setting to change, see `statuscfg tuning show`.
+        `<value>`: The new value.
+        """
+        if key not in TUNABLES:
+            await ctx.send("That setting does not exist.")
+            return
+
+        kind, minimum, maximum, _ = TUNABLES[key]
+        parsed: Any
+        if kind is str:
+            parsed = value
+        elif kind is bool:
+            if value.lower() not in ("true", "false", "yes", "no", "on", "off"):
+                await ctx.send(f"`{key}` must be true or false.")
+                return
+
+            parsed = value.lower() in ("true", "yes", "on")
+        else:
+            try:
+                parsed = kind(value)
+            except ValueError:
+                await ctx.send(f"`{key}` must be a number.")
+                return
+
+            if not minimum <= parsed <= maximum:
+                await ctx.send(f"`{key}` must be between {minimum} and {maximum}.")
+                return
+
+        await self.config.get_attr(key).set(parsed)
+        await self.apply_settings()
+        await ctx.tick()
+
+    @statuscfg.command()
+    async def stats(self, ctx: commands.Context) -> None:
+        """
+        Shows how well the status watcher is keeping up.
+        """
+        metrics = self.metrics
+        cache = self.status_cache
+        lookups = cache.hits + cache.misses + cache.coalesced
+
+        lines = [
+            f"**Uptime:** {humanize_timedelta(seconds=int(time.time() - metrics.started)) or '0 seconds'}",
+            f"**Servers scheduled:** {len(self.poll_scheduler)}, {len(self.breaker)} unreachable",
+            f"**Warm start:** {len(self.warming_up or ())} watches not updated since startup",
+            f"**Loop duration:** avg {metrics.loop_duration.mean:.2f}s, p95 <= {metrics.loop_duration.quantile(0.95)}s over {metrics.loop_duration.count} iterations",
+            f"**Poll lag:** avg {metrics.loop_lag.mean:.2f}s, p95 <= {metrics.loop_lag.quantile(0.95)}s",
+            f"**Poll duration:** avg {metrics.poll_duration.mean:.2f}s, p95 <= {metrics.poll_duration.quantile(0.95)}s over {metrics.poll_duration.count} polls",
+            f"**Edit outbox:** {len(self.edit_outbox)} waiting, oldest {self.edit_outbox.oldest_age():.0f}s behind, "
+            f"avg {metrics.edit_age.mean:.0f}s behind when sent, {self.edit_outbox.replaced} renders replaced while waiting",
+            f"**Status cache:** {len(cache)} entries, {cache.hits} hits, {cache.coalesced} coalesced, {cache.misses} misses"
+            + (f" ({(cache.hits + cache.coalesced) / lookups:.0%} hit rate)" if lookups else ""),
+            "**Discord:** "
+            + ", ".join(
+                f"{metrics.counters[name]} {label}"
+                for name, label in (
+                    ("discord_fetches", "fetches"),
+                    ("discord_edits", "edits"),
+                    ("edits_skipped", "skipped edits"),
+                    ("edits_replaced", "superseded edits"),
+                    ("events_sent", "event announcements"),
+                    ("discord_ratelimited", "rate limited (bot-wide)"),
+                )
+            ),
+            f"**Circuit breaker:** {metrics.counters['breaker_opened']} opened, "
+            f"{metrics.counters['breaker_rejected']} queries skipped",
+            f"**DNS:** {len(self.resolver)} cached, {self.resolver.hits} hits, {self.resolver.misses} lookups, "
+            f"{self.resolver.races} dual-stack races",
+        ]
+        if metrics.errors:
+            lines.append(
+                "**Errors:** "
+                + ", ".join(f"{name}: {count}" for name, count in metrics.errors.most_common())
+            )
+
+        index = await self.get_server_index(cast(discord.Guild, ctx.guild))
+        latencies = []
+        for name, data in sorted(index.servers.items()):
+            hist = metrics.fetch_latency.get(get_status_key(data))
+            if hist is not None and hist.count:
+                latencies.append(
+                    f"`{name}`: avg {hist.mean * 1000:.0f}ms, p95 <= {hist.quantile(0.95)}s ({hist.count} fetches)"
+                )
+        if latencies:
+            lines.append("\n**Fetch latency**")
+            lines.extend(latencies)
+
+        for page in pagify("\n".join(lines)):
+            await ctx.send(page)
+
+    def metric_gauges(self) -> List[Tuple[str, str, float]]:
+        cache = self.status_cache
+        return [
+            ("status_cache_entries", "Snapshots held by the status cache.", len(cache)),
+            ("status_cache_hits", "Status lookups answered from the cache.", cache.hits),
+            ("status_cache_coalesced", "Status lookups that joined an in-flight fetch.", cache.coalesced),
+            ("status_cache_misses", "Status lookups that started a fetch.", cache.misses),
+            ("scheduled_servers", "Servers on the poll schedule.", len(self.poll_scheduler)),
+            ("open_circuits", "Servers whose circuit breaker is open.", len(self.breaker)),
+            ("edit_outbox_depth", "Watch messages with an edit waiting in the outbox.", len(self.edit_outbox)),
+            ("edit_outbox_oldest_seconds", "How long the longest waiting watch message has been out of date.", self.edit_outbox.oldest_age()),
+            ("edit_outbox_replaced", "Renders that replaced an edit still waiting in the outbox.", self.edit_outbox.replaced),
+            ("dns_cache_entries", "Host lookups held by the DNS cache, failures included.", len(self.resolver)),
+            ("dns_cache_hits", "Host lookups answered from the DNS cache.", self.resolver.hits),
+            ("dns_cache_misses", "Host lookups sent to the system resolver.", self.resolver.misses),
+        ]
+
+    async def http_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.metrics.render_prometheus(self.metric_gauges()).encode(),
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+
+    async def http_guild_status(self, request: web.Request) -> web.Response:
+        index = await self.get_http_server_index(request)
+        servers = await asyncio.gather(
+            *(self.get_http_snapshot(name, data) for name, data in sorted(index.servers.items()))
+        )
+        # Refetches that found the same status don't make consumers download it again.
+        version = [dict(server, fetched_at=None) for server in servers]
+        return json_response(request, {"servers": servers}, version)
+
+    async def http_server_status(self, request: web.Request) -> web.Response:
+        index = await self.get_http_server_index(request)
+        name = request.match_info["name"]
+        data = index.get(name)
+        if data is None:
+            raise web.HTTPNotFound(text="No such server.")
+        server = await self.get_http_snapshot(name.lower(), data)
+        return json_response(request, server, dict(server, fetched_at=None))
+
+    async def get_http_server_index(self, request: web.Request) -> ServerIndex:
+        try:
+            guild = self.bot.get_guild(int(request.match_info["guild_id"]))
+        except ValueError:
+            guild = None
+        if guild is None:
+            raise web.HTTPNotFound(text="No such guild.")
+        return await self.get_server_index(guild)
+
+    async def get_http_snapshot(self, name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the status of a server for the HTTP endpoint.
+
+        Servers the watcher polls are served as it last saw them, consumers never cause
+        extra queries to them. Anyone else's go through the status cache, so they are
+        contacted at most once per cache TTL. If a server can't be reached, the last
+        known status is served with the error.
+        """
+        key = get_status_key(config)
+        error = None
+        snapshot: Optional[Snapshot]
+        if self.watch_table is not None and key in self.watch_table:
+            snapshot = self.status_cache.peek(key)
+            if self.breaker.open_since(key) is not None:
+                error = "CircuitOpen"
+        else:
+            try:
+                snapshot = await self.fetch_status_snapshot(config)
+            except StatusFetchError as e:
+                error = type(e.__context__ or e).__name__
+                snapshot = self.status_cache.peek(key)
+
+        status = snapshot.data if snapshot is not None else None
+        longname = get_status_name(config)
+        if status is not None and longname:
+            status = dict(status, name=longname)
+
+        return {
+            "name": name,
+            "longname": config.get("name"),
+            "type": config.get("type", "ss14"),
+            "status": status,
+            "fetched_at": snapshot.fetched_at if snapshot is not None else None,
+            "error": error,
+            "unreachable_since": self.breaker.open_since(key),
+        }
+
     @printer.before_loop
     async def before_loop(self):
+        await self.apply_settings()
+        await self.uptime.load()
         await self.bot.wait_until_ready()
 
 
@@ -513,6 +2234,106 @@ def get_ss14_status_url(url: str) -> str:
     )
 
 
+def get_status_key(server: Dict[str, Any]) -> str:
+    """Returns the normalized address a server's status is cached and tracked under."""
+    if server.get("type") == "ss13":
+        address, port = get_ss13_status_addr(server["address"])
+        return f"byond://{address}:{port}"
+
+    if server.get("type") == "qstat":
+        _, default_port = SUPPORTED_QSTAT_TYPES[server["qstat_type"]]
+        address, port = get_udp_status_addr(server["address"], default_port)
+        return f"{server['qstat_type']}://{address}:{port}"
+
+    return get_ss14_status_url(server["address"])
+
+
+def get_status_host(server: Dict[str, Any]) -> str:
+    return cast(str, urlparse(get_status_key(server)).hostname)
+
+
+def get_status_name(server: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the configured long name to show instead of the name in a server's status.
+
+    SS14 servers report their own name, SS13 and qstat servers are shown under the long name.
+    """
+    if server.get("type", "ss14") == "ss14":
+        return None
+    return server.get("name") or None
+
+
+def render_ss14_status(
+    json: Dict[str, Any], granularity: Optional[int] = None, name: Optional[str] = None
+) -> Dict[str, str]:
+    """
+    Turns a raw SS14 status payload into the fields shown by the status layouts.
+
+    `granularity` rounds the round time down to that many minutes, so it only
+    changes every so often. `name` replaces the name the server reported.
+    """
+    count = json.get("players", "?")
+    count_max = json.get("soft_max_players", "?")
+    name = name or json.get("name", "?")
+    round_id = json.get("round_id", "?")
+    gamemap = json.get("map", "?")
+    preset = json.get("preset", "?")
+    run_level: Any = json.get("run_level")
+    round_start_time = json.get("round_start_time")
+
+    player_count = f"{count}/{count_max}"
+    if run_level == 1 and round_start_time is not None:
+        start_time = dateutil.parser.isoparse(round_start_time)
+        delta = datetime.now(timezone.utc) - start_time
+        if granularity:
+            step = granularity * 60
+            delta = timedelta(seconds=delta.total_seconds() // step * step)
+        elapsed = humanize_timedelta(timedelta=delta, maximum_units=2)
+        if not elapsed:
+            elapsed = f"less than {humanize_timedelta(seconds=(granularity or 1) * 60)}"
+        status = f"{SS14_RUN_LEVEL_STATUS.get(run_level, 'unknown')} ({elapsed})"
+    else:
+        status = SS14_RUN_LEVEL_STATUS.get(run_level, "Unknown")
+
+    return {
+        "name": name,
+        "player_count": player_count,
+        "status": status,
+        "gamemap": gamemap,
+        "preset": preset,
+        "round_id": round_id,
+    }
+
+
+def render_status_event(
+    json: Dict[str, Any],
+    event: StatusEvent,
+    threshold: Optional[int] = None,
+    name: Optional[str] = None,
+) -> str:
+    """
+    Formats a status event as a chat line, `threshold` is the one a `players` event crossed.
+
+    `name` replaces the name the server reported.
+    """
+    name = name or json.get("name", "?")
+    if event.kind == "round":
+        return "New round {round_id} on **{name}**. Map: {map}, preset: {preset}.".format(
+            round_id=event.new,
+            name=name,
+            map=json.get("map") or "?",
+            preset=json.get("preset") or "?",
+        )
+
+    if event.kind == "run_level":
+        status = SS14_RUN_LEVEL_STATUS.get(event.new, "Unknown")
+        return f"**{name}** is now {status.lower()} (round {json.get('round_id', '?')})."
+
+    if event.new > event.old:
+        return f"**{name}** reached {threshold} players ({event.new} online)."
+    return f"**{name}** dropped below {threshold} players ({event.new} online)."
+
+
 def legacy_embed(
     *,
     name: str,
@@ -535,8 +2356,12 @@ def legacy_embed(
 T = TypeVar("T")
 
 
-# .NET List<T>.RemoveAll(Predicate<T>)
-# O(n^2) worst case (.NET's is O(n))
-def remove_list_elems(itter_list: List[T], pred: Callable[[T], bool]) -> None:
-    for i in list(filter(pred, itter_list)):
-        itter_list.remove(i)
+# .NET List<T>.RemoveAll(Predicate<T>), in a single pass.
+# Returns the removed elements.
+def remove_list_elems(itter_list: List[T], pred: Callable[[T], bool]) -> List[T]:
+    kept: List[T] = []
+    removed: List[T] = []
+    for i in itter_list:
+        (removed if pred(i) else kept).append(i)
+    itter_list[:] = kept
+    return removed
@@ -0,0 +1,106 @@
+import time
+
+from typing import Any, Dict, List, Optional
+
+
+class _Circuit:
+    __slots__ = ("failures", "failing_since", "open", "probe_at", "cooldown")
+
+    def __init__(self) -> None:
+        self.failures = 0
+        # Wall time of the first failure in the current streak.
+        self.failing_since = 0.0
+        self.open = False
+        # Monotonic time the next half-open probe is allowed at.
+        self.probe_at = 0.0
+        self.cooldown = 0.0
+
+
+class CircuitBreaker:
+    """
+    Per status key circuit breaker.
+
+    After `threshold` failures in a row the circuit opens and `allow` turns requests
+    down. Once the cooldown has passed a single probe is let through, success closes
+    the circuit and failure opens it again with the cooldown doubled, up to `max_cooldown`.
+    """
+
+    def __init__(self, threshold: int, cooldown: float, max_cooldown: float) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def __len__(self) -> int:
+        """Number of open circuits."""
+        return sum(1 for c in self._circuits.values() if c.open)
+
+    def allow(self, key: str) -> bool:
+        """Returns whether a request to `key` may go out, taking the probe if it is one."""
+        circuit = self._circuits.get(key)
+        if circuit is None or not circuit.open:
+            return True
+
+        now = time.monotonic()
+        if now < circuit.probe_at:
+            return False
+
+        # Hold off other probes until this one has had its chance.
+        circuit.probe_at = now + circuit.cooldown
+        return True
+
+    def success(self, key: str) -> bool:
+        """Records a successful request, returns whether that closed an open circuit."""
+        circuit = self._circuits.pop(key, None)
+        return circuit is not None and circuit.open
+
+    def failure(self, key: str) -> bool:
+        """Records a failed request, returns whether that opened the circuit."""
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit()
+            circuit.failing_since = time.time()
+
+        circuit.failures += 1
+        if circuit.open:
+            circuit.cooldown = min(circuit.cooldown * 2, self.max_cooldown)
+            circuit.probe_at = time.monotonic() + circuit.cooldown
+            return False
+
+        if circuit.failures < self.threshold:
+            return False
+
+        circuit.open = True
+        circuit.cooldown = self.cooldown
+        circuit.probe_at = time.monotonic() + circuit.cooldown
+        return True
+
+    def open_since(self, key: str) -> Optional[float]:
+        """Returns when `key` started failing if its circuit is open, None otherwise."""
+        circuit = self._circuits.get(key)
+        if circuit is None or not circuit.open:
+            return None
+        return circuit.failing_since
+
+    def dump(self) -> Dict[str, List[Any]]:
+        """Returns the state of every failing key, with probe times as seconds from now."""
+        now = time.monotonic()
+        return {
+            key: [c.failures, c.failing_since, c.open, c.probe_at - now, c.cooldown]
+            for key, c in self._circuits.items()
+        }
+
+    def restore(self, state: Dict[str, List[Any]], elapsed: float) -> None:
+        """
+        Puts back circuits saved by `dump` `elapsed` seconds ago, keys already tracked here win.
+        """
+        now = time.monotonic() - elapsed
+        for key, (failures, failing_since, is_open, probe_in, cooldown) in state.items():
+            if key in self._circuits:
+                continue
+            circuit = self._circuits[key] = _Circuit()
+            circuit.failures = failures
+            circuit.failing_since = failing_since
+            circuit.open = is_open
+            circuit.probe_at = now + probe_in
+            circuit.cooldown = cooldown
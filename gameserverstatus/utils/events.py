@@ -0,0 +1,45 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+
+class StatusEvent(NamedTuple):
+    """
+    A change between two status snapshots of the same server.
+
+    `kind` is one of `round` (new round ID), `run_level` or `players`.
+    """
+
+    kind: str
+    old: Any
+    new: Any
+
+
+def diff_status(previous: Dict[str, Any], current: Dict[str, Any]) -> List[StatusEvent]:
+    """Compares two status payloads of a server and returns what changed between them."""
+    events = []
+    if current.get("round_id") != previous.get("round_id"):
+        events.append(StatusEvent("round", previous.get("round_id"), current.get("round_id")))
+
+    if current.get("run_level") != previous.get("run_level"):
+        events.append(
+            StatusEvent("run_level", previous.get("run_level"), current.get("run_level"))
+        )
+
+    old_players = previous.get("players")
+    new_players = current.get("players")
+    if isinstance(old_players, int) and isinstance(new_players, int) and old_players != new_players:
+        events.append(StatusEvent("players", old_players, new_players))
+
+    return events
+
+
+def crossed_threshold(event: StatusEvent, thresholds: Iterable[int]) -> Optional[int]:
+    """
+    Returns the threshold a `players` event went across, or None if it crossed none.
+
+    Reaching a threshold counts as crossing it going up, dropping below it going down.
+    If several were crossed at once, the last one passed is returned.
+    """
+    crossed = [t for t in thresholds if min(event.old, event.new) < t <= max(event.old, event.new)]
+    if not crossed:
+        return None
+    return max(crossed) if event.new > event.old else min(crossed)
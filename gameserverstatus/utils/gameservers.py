@@ -98,3 +98,11 @@ QSTAT_TYPES = {
     "xonotics": "Xonotic server",
     "zeq2lites": "ZEQ2 Lite server",
 }
+
+# QStat types that can be queried natively, mapped to (protocol family, default port).
+SUPPORTED_QSTAT_TYPES = {
+    "a2s": ("a2s", 27015),
+    "hl2s": ("a2s", 27015),
+    "q3s": ("q3", 27960),
+    "woets": ("q3", 27960),
+}
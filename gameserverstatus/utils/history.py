@@ -0,0 +1,176 @@
+import asyncio
+import sqlite3
+import time
+
+from array import array
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Retention per resolution, in hours.
+RAW_RETENTION = 7 * 24
+HOURLY_RETENTION = 90 * 24
+DAILY_RETENTION = 730 * 24
+
+# Marks a minute without a sample in the raw arrays.
+NO_SAMPLE = -1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS raw (
+    key TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    minutes BLOB NOT NULL,
+    PRIMARY KEY (key, hour)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS hourly (
+    key TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    low INTEGER NOT NULL,
+    high INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    PRIMARY KEY (key, hour)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS daily (
+    key TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    low INTEGER NOT NULL,
+    high INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    samples INTEGER NOT NULL,
+    PRIMARY KEY (key, day)
+) WITHOUT ROWID;
+"""
+
+
+class Rollup(NamedTuple):
+    # Unix timestamp the bucket starts at.
+    start: int
+    low: int
+    high: int
+    average: float
+    samples: int
+
+
+class PlayerHistory:
+    """
+    Player count time series per status key, stored in SQLite.
+
+    Samples are kept per minute in an in-memory array for the current hour and
+    written out on `flush`, together with the hourly and daily min/avg/max rollups
+    of that hour. Queries only ever read the rollup tables.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = asyncio.Lock()
+        # key -> (hour, per-minute player counts) for the hour currently being filled.
+        self._current: Dict[str, Tuple[int, "array[int]"]] = {}
+        # Finished hours waiting to be written out.
+        self._pending: List[Tuple[str, int, "array[int]"]] = []
+
+    def record(self, key: str, players: int, when: float) -> None:
+        hour, minute = divmod(int(when) // 60, 60)
+        current = self._current.get(key)
+        if current is None or current[0] != hour:
+            if current is not None:
+                self._pending.append((key, *current))
+            current = (hour, array("h", [NO_SAMPLE] * 60))
+            self._current[key] = current
+
+        minutes = current[1]
+        minutes[minute] = max(minutes[minute], min(players, 0x7FFF))
+
+    async def flush(self) -> None:
+        async with self._lock:
+            # Copies, so samples recorded while the write runs don't race with it.
+            batch = self._pending + [
+                (key, hour, array("h", minutes))
+                for key, (hour, minutes) in self._current.items()
+            ]
+            self._pending = []
+            if batch:
+                await asyncio.to_thread(self._write, batch)
+
+            # Hours that are over have been written for good.
+            hour = int(time.time()) // 3600
+            self._current = {
+                key: cur for key, cur in self._current.items() if cur[0] >= hour
+            }
+
+    async def query(self, key: str, start: float, end: float, daily: bool) -> List[Rollup]:
+        """Returns the hourly or daily rollups of `key` between `start` and `end`."""
+        await self.flush()
+        async with self._lock:
+            return await asyncio.to_thread(self._read, key, start, end, daily)
+
+    async def close(self) -> None:
+        await self.flush()
+        async with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def _write(self, batch: List[Tuple[str, int, "array[int]"]]) -> None:
+        conn = self._connect()
+        with conn:
+            for key, hour, minutes in batch:
+                # Merge with whatever an earlier run already wrote for this hour.
+                row = conn.execute(
+                    "SELECT minutes FROM raw WHERE key = ? AND hour = ?", (key, hour)
+                ).fetchone()
+                if row is not None:
+                    stored = array("h")
+                    stored.frombytes(row[0])
+                    minutes = array("h", map(max, minutes, stored))
+
+                values = [v for v in minutes if v != NO_SAMPLE]
+                if not values:
+                    continue
+
+                conn.execute(
+                    "INSERT OR REPLACE INTO raw VALUES (?, ?, ?)",
+                    (key, hour, minutes.tobytes()),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO hourly VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, hour, min(values), max(values), sum(values), len(values)),
+                )
+                day = hour // 24
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO daily
+                    SELECT key, ?, MIN(low), MAX(high), SUM(total), SUM(samples)
+                    FROM hourly WHERE key = ? AND hour >= ? AND hour < ?
+                    """,
+                    (day, key, day * 24, day * 24 + 24),
+                )
+
+            newest = max(hour for _, hour, _ in batch)
+            conn.execute("DELETE FROM raw WHERE hour < ?", (newest - RAW_RETENTION,))
+            conn.execute("DELETE FROM hourly WHERE hour < ?", (newest - HOURLY_RETENTION,))
+            conn.execute(
+                "DELETE FROM daily WHERE day < ?", ((newest - DAILY_RETENTION) // 24,)
+            )
+
+    def _read(self, key: str, start: float, end: float, daily: bool) -> List[Rollup]:
+        span = 86400 if daily else 3600
+        table, column = ("daily", "day") if daily else ("hourly", "hour")
+        rows = self._connect().execute(
+            f"""
+            SELECT {column}, low, high, total, samples FROM {table}
+            WHERE key = ? AND {column} >= ? AND {column} <= ?
+            ORDER BY {column}
+            """,
+            (key, int(start) // span, int(end) // span),
+        )
+        return [
+            Rollup(bucket * span, low, high, total / samples, samples)
+            for bucket, low, high, total, samples in rows
+        ]
@@ -0,0 +1,65 @@
+import hashlib
+import json
+
+from typing import Any, List, Optional, Tuple
+
+from aiohttp import web
+
+
+class LocalHTTPServer:
+    """
+    Small aiohttp web server for exposing the cog's data to local tools.
+
+    A fresh application is built from `routes` on every start, so the server can be
+    moved to another address without reloading the cog.
+    """
+
+    def __init__(self, routes: List[web.RouteDef]) -> None:
+        self.routes = routes
+        self.address: Optional[Tuple[str, int]] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self, host: str, port: int) -> None:
+        if self._runner is not None and self.address == (host, port):
+            return
+
+        await self.stop()
+        app = web.Application()
+        app.add_routes(self.routes)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port).start()
+        except BaseException:
+            await runner.cleanup()
+            raise
+
+        self._runner = runner
+        self.address = (host, port)
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self.address = None
+
+
+def json_response(request: web.Request, payload: Any, version: Any) -> web.Response:
+    """
+    Serializes `payload`, with a weak ETag derived from `version` alone. Parts of the
+    payload left out of `version` can change without clients fetching it again.
+
+    Answers 304 Not Modified if the client already has that version.
+    """
+    tag = json.dumps(version, separators=(",", ":"), sort_keys=True, default=str).encode()
+    etag = 'W/"' + hashlib.blake2b(tag, digest_size=16).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    # Weak comparison, as RFC 9110 asks for on If-None-Match.
+    known = request.headers.get("If-None-Match", "")
+    tags = {tag.strip().removeprefix("W/") for tag in known.split(",")}
+    if etag.removeprefix("W/") in tags or "*" in tags:
+        return web.Response(status=304, headers=headers)
+
+    body = json.dumps(payload, separators=(",", ":"), sort_keys=True, default=str).encode()
+    return web.Response(body=body, content_type="application/json", headers=headers)
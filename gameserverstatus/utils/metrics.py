@@ -0,0 +1,150 @@
+import bisect
+import logging
+import time
+
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Upper bounds, in seconds, of the histogram buckets.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LOOP_BUCKETS = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+EDIT_AGE_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+PROMETHEUS_PREFIX = "gameserverstatus"
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds = bounds
+        # One count per bound plus the overflow bucket, not cumulative.
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the `q` quantile, good enough for a glance."""
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class StatusMetrics:
+    """Counters and histograms describing how the status cog is keeping up."""
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        # Status key -> how long fetching that server's status took.
+        self.fetch_latency: Dict[str, Histogram] = defaultdict(Histogram)
+        # How long a watcher loop iteration that started any poll took, warm start and
+        # table refresh included. The polls themselves run on after the iteration.
+        self.loop_duration = Histogram(LOOP_BUCKETS)
+        # How long a poll took from starting until every watch showing it was rendered.
+        self.poll_duration = Histogram(LOOP_BUCKETS)
+        # How late servers were polled compared to when they were due.
+        self.loop_lag = Histogram(LOOP_BUCKETS)
+        # How long watch messages were out of date by the time their edit was sent.
+        self.edit_age = Histogram(EDIT_AGE_BUCKETS)
+        # Discord calls and other events, see the keys used by the cog.
+        self.counters: Counter = Counter()
+        # Exception type name -> times seen.
+        self.errors: Counter = Counter()
+
+    def error(self, exc: BaseException) -> None:
+        self.errors[type(exc).__name__] += 1
+
+    def render_prometheus(self, gauges: Iterable[Tuple[str, str, float]] = ()) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format.
+
+        `gauges` are extra (name, help, value) samples owned by someone else, like the
+        status cache's hit counts.
+        """
+        lines: List[str] = []
+
+        def header(name: str, kind: str, description: str) -> str:
+            full = f"{PROMETHEUS_PREFIX}_{name}"
+            lines.append(f"# HELP {full} {description}")
+            lines.append(f"# TYPE {full} {kind}")
+            return full
+
+        def histogram(full: str, hist: Histogram, labels: str = "") -> None:
+            sep = "," if labels else ""
+            cumulative = 0
+            for bound, count in zip(hist.bounds, hist.counts):
+                cumulative += count
+                lines.append(f'{full}_bucket{{{labels}{sep}le="{bound}"}} {cumulative}')
+            lines.append(f'{full}_bucket{{{labels}{sep}le="+Inf"}} {hist.count}')
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{full}_sum{suffix} {hist.total}")
+            lines.append(f"{full}_count{suffix} {hist.count}")
+
+        full = header("fetch_latency_seconds", "histogram", "Time taken to fetch a server's status.")
+        for key, hist in sorted(self.fetch_latency.items()):
+            histogram(full, hist, f'server="{_escape(key)}"')
+
+        histogram(
+            header("loop_duration_seconds", "histogram", "Duration of watcher loop iterations that started polls."),
+            self.loop_duration,
+        )
+        histogram(
+            header("poll_duration_seconds", "histogram", "Duration of server polls, rendering the watches included."),
+            self.poll_duration,
+        )
+        histogram(
+            header("loop_lag_seconds", "histogram", "How late servers were polled after they were due."),
+            self.loop_lag,
+        )
+        histogram(
+            header("edit_age_seconds", "histogram", "How long watch messages were out of date when their edit was sent."),
+            self.edit_age,
+        )
+
+        full = header("events_total", "counter", "Discord calls and other watcher events.")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f'{full}{{event="{_escape(name)}"}} {value}')
+
+        full = header("errors_total", "counter", "Errors by exception type.")
+        for name, value in sorted(self.errors.items()):
+            lines.append(f'{full}{{type="{_escape(name)}"}} {value}')
+
+        for name, description, sample in gauges:
+            lines.append(f"{header(name, 'gauge', description)} {sample}")
+
+        return "\n".join(lines) + "\n"
+
+
+class RateLimitCounter(logging.Filter):
+    """
+    Counts the 429s discord.py reports on its HTTP logger.
+
+    discord.py retries rate limited requests on its own, the warning it logs is the
+    only trace they leave.
+    """
+
+    def __init__(self, metrics: StatusMetrics) -> None:
+        super().__init__()
+        self.metrics = metrics
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.msg, str) and "responded with 429" in record.msg:
+            self.metrics.counters["discord_ratelimited"] += 1
+        return True
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,89 @@
+import asyncio
+import time
+
+from collections import deque
+from typing import Deque, Dict, Generic, List, Optional, Tuple, TypeVar
+
+from .scheduler import PollScheduler
+
+T = TypeVar("T")
+
+
+class EditOutbox(Generic[T]):
+    """
+    Pending message edits keyed by message ID, each released at its own time.
+
+    Putting an edit for a message that already has one waiting replaces it. The
+    message keeps its place in line and only the newest render is ever taken out,
+    even if it arrives after the message's time came up.
+    """
+
+    def __init__(self) -> None:
+        # Message ID -> (payload, wall time the message first went out of date).
+        self._entries: Dict[int, Tuple[T, float]] = {}
+        self._slots: PollScheduler[int] = PollScheduler()
+        # Messages whose time came up, in the order it did.
+        self._ready: Deque[int] = deque()
+        self._wakeup = asyncio.Event()
+        self.replaced = 0
+
+    def __contains__(self, msg_id: int) -> bool:
+        return msg_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, msg_id: int) -> Optional[T]:
+        entry = self._entries.get(msg_id)
+        return entry[0] if entry is not None else None
+
+    def put(self, msg_id: int, payload: T, when: float) -> None:
+        """Queues `payload` for `msg_id`, to be released at wall time `when` unless already queued."""
+        entry = self._entries.get(msg_id)
+        if entry is not None:
+            self.replaced += 1
+            self._entries[msg_id] = (payload, entry[1])
+            return
+
+        self._entries[msg_id] = (payload, time.time())
+        self._slots.schedule(msg_id, when)
+        self._wakeup.set()
+
+    def discard(self, msg_id: int) -> None:
+        self._entries.pop(msg_id, None)
+        self._slots.discard(msg_id)
+
+    def message_ids(self) -> List[int]:
+        return list(self._entries)
+
+    def oldest_age(self) -> float:
+        """Seconds the longest waiting message has been out of date."""
+        if not self._entries:
+            return 0.0
+        return time.time() - min(queued for _, queued in self._entries.values())
+
+    async def take(self) -> Tuple[int, T, float]:
+        """
+        Waits for the next edit whose time has come and takes it out of the outbox.
+
+        Returns the message ID, the newest payload for it and how many seconds the
+        message has been out of date.
+        """
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+            self._ready.extend(msg_id for msg_id, _ in self._slots.pop_due(now))
+            while self._ready:
+                msg_id = self._ready.popleft()
+                entry = self._entries.pop(msg_id, None)
+                if entry is not None:  # Discarded since its time came up otherwise.
+                    return msg_id, entry[0], now - entry[1]
+
+            next_due = self._slots.next_due()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=None if next_due is None else next_due - now,
+                )
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,79 @@
+import bisect
+
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class ServerIndex:
+    """
+    Lookup index over the servers configured in one guild.
+
+    Built once from the guild's `servers` config and thrown away whenever that
+    changes. Names are matched case-insensitively, searches also look at the
+    server's long name.
+    """
+
+    def __init__(self, servers: Dict[str, Dict[str, Any]]) -> None:
+        self.servers = {name.lower(): data for name, data in servers.items()}
+        # Sorted short names, so prefix matches are a bisect away.
+        self._names = sorted(self.servers)
+        # (short name, lowercased long name, words of the long name)
+        self._entries: List[Tuple[str, str, List[str]]] = []
+        for name in self._names:
+            longname = (self.servers[name].get("name") or "").lower()
+            self._entries.append((name, longname, longname.split()))
+
+    def __len__(self) -> int:
+        return len(self.servers)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.servers.get(name.lower())
+
+    def search(self, query: str, limit: int = 25) -> List[str]:
+        """Returns up to `limit` server names matching `query`, best matches first."""
+        query = query.lower().strip()
+        if not query:
+            return self._names[:limit]
+
+        ranked: Dict[str, Tuple[int, int]] = {}
+
+        # Short name prefix matches, straight from the sorted list.
+        start = bisect.bisect_left(self._names, query)
+        for name in self._names[start:]:
+            if not name.startswith(query):
+                break
+            ranked[name] = (0 if name == query else 1, len(name))
+
+        for name, longname, words in self._entries:
+            if name in ranked:
+                continue
+
+            if any(word.startswith(query) for word in words):
+                ranked[name] = (2, len(name))
+            elif query in name:
+                ranked[name] = (3, name.index(query))
+            elif query in longname:
+                ranked[name] = (4, longname.index(query))
+            else:
+                spread = _subsequence_spread(query, name)
+                if spread is None:
+                    spread = _subsequence_spread(query, longname)
+                if spread is not None:
+                    ranked[name] = (5, spread)
+
+        return sorted(ranked, key=lambda name: (ranked[name], name))[:limit]
+
+
+def _subsequence_spread(query: str, text: str) -> Optional[int]:
+    """
+    Returns how spread out the characters of `query` are when found in order in
+    `text`, or None if they aren't all there. Smaller is a closer match.
+    """
+    first = pos = text.find(query[0])
+    if pos == -1:
+        return None
+
+    for char in query[1:]:
+        pos = text.find(char, pos + 1)
+        if pos == -1:
+            return None
+    return pos - first - len(query) + 1
@@ -0,0 +1,155 @@
+import asyncio
+import socket
+import time
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from aiohttp.abc import AbstractResolver
+
+# Seconds to give the preferred address family before racing the other one (RFC 8305).
+RACE_DELAY = 0.25
+# Seconds a race may take before the addresses are used in resolver order.
+RACE_TIMEOUT = 3.0
+
+
+class CachingResolver(AbstractResolver):
+    """
+    aiohttp resolver that caches answers, failures included, and orders dual-stack
+    hosts by which address family actually connects.
+
+    When a host has both IPv4 and IPv6 addresses, one connection per family is raced
+    happy-eyeballs style and the winning family is listed first, so a host with
+    broken IPv6 costs one short race per `ttl` instead of a connect timeout per request.
+    The resolver can be shared between sessions, closing it is a no-op.
+    """
+
+    def __init__(self, ttl: float, negative_ttl: float) -> None:
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # (host, port, family) -> (expiry, addresses or the lookup error's message)
+        self._cache: Dict[Tuple[str, int, int], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[str, int, int], "asyncio.Task[List[Dict[str, Any]]]"] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.races = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    async def resolve(
+        self, host: str, port: int = 0, family: int = socket.AF_INET
+    ) -> List[Dict[str, Any]]:
+        key = (host, port, family)
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self.hits += 1
+            if isinstance(entry[1], str):
+                # A new exception per caller, raising a shared one would chain their tracebacks onto it.
+                raise OSError(entry[1])
+            return [dict(addr) for addr in entry[1]]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fill(key))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+
+        addresses = await asyncio.shield(task)
+        return [dict(addr) for addr in addresses]
+
+    async def close(self) -> None:
+        pass
+
+    async def _fill(self, key: Tuple[str, int, int]) -> List[Dict[str, Any]]:
+        host, port, family = key
+        try:
+            self._prune()
+            try:
+                addresses = await self._lookup(host, port, family)
+            except OSError as e:
+                self._cache[key] = (time.monotonic() + self.negative_ttl, str(e))
+                raise
+
+            if len({addr["family"] for addr in addresses}) > 1:
+                addresses = await self._race(addresses)
+            self._cache[key] = (time.monotonic() + self.ttl, addresses)
+            return addresses
+        finally:
+            del self._inflight[key]
+
+    def _prune(self) -> None:
+        """Drops expired answers, hosts that are no longer looked up would stay forever otherwise."""
+        now = time.monotonic()
+        for key in [key for key, (expiry, _) in self._cache.items() if expiry <= now]:
+            del self._cache[key]
+
+    async def _lookup(self, host: str, port: int, family: int) -> List[Dict[str, Any]]:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM, family=family, flags=socket.AI_ADDRCONFIG
+        )
+
+        addresses = []
+        seen = set()
+        for family, _, proto, _, address in infos:
+            if address in seen:
+                continue
+            seen.add(address)
+            addresses.append(
+                {
+                    "hostname": host,
+                    "host": address[0],
+                    "port": address[1],
+                    "family": family,
+                    "proto": proto,
+                    "flags": socket.AI_NUMERICHOST | socket.AI_NUMERICSERV,
+                }
+            )
+        if not addresses:
+            raise OSError(f"No addresses found for {host}")
+        return addresses
+
+    async def _race(self, addresses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Connects to the first address of each family, the family connecting first goes first."""
+        self.races += 1
+        firsts: Dict[int, Dict[str, Any]] = {}
+        for addr in addresses:
+            firsts.setdefault(addr["family"], addr)
+
+        winner: Optional[int] = None
+        attempts = []
+        try:
+            for delay, addr in enumerate(firsts.values()):
+                attempts.append(asyncio.create_task(self._attempt(addr, delay * RACE_DELAY)))
+
+            for attempt in asyncio.as_completed(attempts, timeout=RACE_TIMEOUT):
+                try:
+                    winner = await attempt
+                    break
+                except OSError:
+                    continue
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+
+        if winner is None:
+            return addresses
+
+        # Interleave the families, the winner's addresses first.
+        preferred = [addr for addr in addresses if addr["family"] == winner]
+        others = [addr for addr in addresses if addr["family"] != winner]
+        ordered = []
+        for i in range(max(len(preferred), len(others))):
+            ordered.extend(preferred[i : i + 1])
+            ordered.extend(others[i : i + 1])
+        return ordered
+
+    async def _attempt(self, addr: Dict[str, Any], delay: float) -> int:
+        await asyncio.sleep(delay)
+        _, writer = await asyncio.open_connection(addr["host"], addr["port"])
+        writer.close()
+        return addr["family"]
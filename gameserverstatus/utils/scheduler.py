@@ -0,0 +1,105 @@
+import heapq
+import random
+import zlib
+
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+# Seconds between polls, picked by the run level the server last reported.
+POLL_INTERVAL_TRANSITION = 20.0  # Lobby and round end, things are about to change.
+POLL_INTERVAL_ROUND = 120.0  # Steady in-game play.
+POLL_INTERVAL_DEFAULT = 60.0  # Unknown run level or the last poll failed.
+
+# Absolute bounds for per-server floor and ceiling overrides.
+POLL_INTERVAL_MIN = 5.0
+POLL_INTERVAL_MAX = 3600.0
+
+# Intervals are spread by up to this fraction so servers don't all fire on the same second.
+POLL_JITTER = 0.1
+
+K = TypeVar("K", bound=Hashable)
+
+
+def edit_slot_time(message_id: int, window: float, now: float) -> float:
+    """
+    Returns the next time at or after `now` that a watch message may be edited.
+
+    Every message gets a fixed slot in each `window` second period, picked by hashing its ID,
+    so the edits of many watches are spread out instead of all landing at once.
+    """
+    if window <= 0:
+        return now
+
+    # Snowflakes sent in a row differ mostly in their timestamp bits, mix them up first.
+    slot = zlib.crc32(message_id.to_bytes(8, "little")) / 0x100000000 * window
+    return now + (slot - now) % window
+
+
+def next_poll_interval(
+    run_level: Optional[int],
+    floor: Optional[float] = None,
+    ceiling: Optional[float] = None,
+) -> float:
+    """Returns how many seconds to wait before polling a server again."""
+    if run_level in (0, 2):
+        interval = POLL_INTERVAL_TRANSITION
+    elif run_level == 1:
+        interval = POLL_INTERVAL_ROUND
+    else:
+        interval = POLL_INTERVAL_DEFAULT
+
+    interval *= random.uniform(1 - POLL_JITTER, 1 + POLL_JITTER)
+    if floor is not None:
+        interval = max(interval, floor)
+    if ceiling is not None:
+        interval = min(interval, ceiling)
+    return max(interval, POLL_INTERVAL_MIN)
+
+
+class PollScheduler(Generic[K]):
+    """
+    Priority queue of keys ordered by the time they are next due.
+
+    Rescheduling a key leaves its old heap entry behind, stale entries are
+    dropped lazily when they reach the top of the heap.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, K]] = []
+        self._due: Dict[K, float] = {}
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._due
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def keys(self) -> List[K]:
+        return list(self._due)
+
+    def due_at(self, key: K) -> Optional[float]:
+        return self._due.get(key)
+
+    def next_due(self) -> Optional[float]:
+        """Returns the earliest time any key is due, or None if nothing is scheduled."""
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def schedule(self, key: K, when: float) -> None:
+        self._due[key] = when
+        heapq.heappush(self._heap, (when, key))
+
+    def discard(self, key: K) -> None:
+        self._due.pop(key, None)
+
+    def pop_due(self, now: float) -> List[Tuple[K, float]]:
+        """Removes and returns every key that is due at `now`, with the time it was due at."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, key = heapq.heappop(self._heap)
+            if self._due.get(key) != when:
+                continue  # Rescheduled or discarded since this entry was pushed.
+
+            del self._due[key]
+            due.append((key, when))
+        return due
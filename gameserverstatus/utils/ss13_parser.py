@@ -1,116 +1,51 @@
 """
-Unused parrts of the SS13 server status parser. Its very unlikely to be used and is here for archival purposes.
-In case someone ever wants to build it into its own thing again (Why? Just use Crossedfall's Cog)
+BYOND world.Topic() client used to query the status of SS13 servers.
 """
 
 
-from typing import Tuple, Union, Dict, List, Optional, cast
-import struct
 import asyncio
-from urllib.parse import urlparse, parse_qs
-from discord.abc import Messageable
-from discord import Embed
-
-
-async def do_status_ss13(
-    self, ctx: Messageable, name: str, dat: Dict[str, str], embed: Embed
-) -> None:
-    cfgurl = dat["address"]
-    longname = dat.get("name")
-    (addr, port) = get_ss13_status_addr(cfgurl)
-    response = await byond_server_topic(addr, port, b"?status")
-
-    embed.title = longname
-    embed.set_footer(text=f"{name}: {cfgurl}")
-
-    mapname: Optional[str]
-    players: str
-    admins: Optional[int] = None  # noqa: F841
-    station_time: Optional[str]
-
-    try:
-        if not isinstance(response, Dict):
-            raise NotImplementedError("Non-list returns are not accepted.")
-
-        mapname = None
-        if "map_name" in response:
-            mapname = response["map_name"][0]
-        station_time = None
-        if "station_time" in response:
-            station_time = response["station_time"][0]
-        players = response["players"][0]
-
-    except:
-        log.exception("Got unsupported response")
-        raise StatusException("Server sent unsupported response.")
-
-    embed.add_field(name="Players Online", value=players)
-    if mapname:
-        embed.add_field(name="Map", value=mapname)
-
-    if station_time:
-        embed.add_field(name="Station Time", value=station_time)
-
-
-def get_ss13_status_addr(url: str) -> Tuple[str, int]:
-    if "//" not in url:
-        url = "//" + url
-
-    parsed = urlparse(url, "byond", allow_fragments=False)
-
-    port = parsed.port
-    if not port:
-        raise ValueError("No port specified!")
-
-    return (cast(str, parsed.hostname), cast(int, parsed.port))
-
-
-"""
-async def get_status_ss13(address: str, port: int, channel: MChannel, admindata: Optional[List[MIdentifier]]) -> None:
-    response = await asyncio.wait_for(byond_server_topic(address, port, b"?status"), timeout=5)
-
-    mapname: Optional[str]
-    players: str
-    admins: Optional[int] = None
-
-    try:
-        if not isinstance(response, Dict):
-            raise NotImplementedError("Non-list returns are not accepted.")
+import struct
 
-        mapname = None
-        if "map_name" in response:
-            mapname = response["map_name"][0]
-        station_time = None
-        if "station_time" in response:
-            station_time = response["station_time"][0]
-        players = response["players"][0]
-        if admindata and "admins" in response:
-            for identifier in admindata:
-                if channel.is_identifier(identifier):
-                    admins = int(response["admins"][0])
-                    break
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple, Union, cast
+from urllib.parse import urlparse, parse_qs
 
-    except:
-        await channel.send("Server sent unsupported response.")
-        log.exception("Got unsupported response")
-        return
+# /tg/-style `gamestate` values mapped onto SS14 run levels.
+SS13_GAMESTATE_RUN_LEVEL = {
+    0: 0,  # Startup
+    1: 0,  # Pregame
+    2: 0,  # Setting up
+    3: 1,  # Playing
+    4: 2,  # Finished
+}
 
-    out = f"{players} players online"
 
-    if mapname:
-        out += f", map is {mapname}"
+class ByondTopicClient:
+    """
+    Sends topic queries to BYOND servers.
 
-    if station_time:
-        out += f", station time: {station_time}"
+    Every query has a hard `timeout` covering connect, send and receive, and at most
+    `host_concurrency` queries run against the same host at once since BYOND answers
+    topics on its single game thread.
+    """
 
-    if admins is not None:
-        out += f", **{admins}** admins online. *Note: unable to provide AFK statistics for administrators.*"
+    def __init__(self, timeout: float, host_concurrency: int) -> None:
+        self.timeout = timeout
+        self.host_concurrency = host_concurrency
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
 
-    else:
-        out += "."
+    async def topic(
+        self, address: str, port: int, message: bytes
+    ) -> Union[float, Dict[str, List[str]]]:
+        semaphore = self._host_semaphores.get(address)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.host_concurrency)
+            self._host_semaphores[address] = semaphore
 
-    await channel.send(out)
- """
+        async with semaphore:
+            return await asyncio.wait_for(
+                byond_server_topic(address, port, message), timeout=self.timeout
+            )
 
 
 async def byond_server_topic(
@@ -128,18 +63,23 @@ async def byond_server_topic(
     packet += b"\x00"
 
     reader, writer = await asyncio.open_connection(address, port)
-    writer.write(packet)
-
-    await writer.drain()
-
-    if await reader.read(2) != b"\x00\x83":
-        raise IOError("BYOND server returned data invalid.")
-
-    # Read response
-    size = struct.unpack(">H", await reader.read(2))[0]
-    response = await reader.read(size)
-    # logger.info(response)
-    writer.close()
+    try:
+        writer.write(packet)
+        await writer.drain()
+
+        # readexactly, a plain read() may hand back a partial packet.
+        header = await reader.readexactly(4)
+        if header[:2] != b"\x00\x83":
+            raise IOError("BYOND server returned data invalid.")
+
+        size = struct.unpack(">H", header[2:])[0]
+        response = await reader.readexactly(size)
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
 
     ret = byond_decode_packet(response)
     if isinstance(ret, str):
@@ -150,10 +90,78 @@ async def byond_server_topic(
 
 # Turns the BYOND packet into either a string or a float.
 def byond_decode_packet(packet: bytes) -> Union[float, str]:
+    if not packet:
+        raise IOError("BYOND server returned an empty response.")
+
     if packet[0] == 0x2A:
-        return cast(float, struct.unpack(">f", packet[1:5])[0])
+        return cast(float, struct.unpack("<f", packet[1:5])[0])
 
     elif packet[0] == 0x06:
-        return packet[1:-1].decode("ascii")
+        return packet[1:-1].decode("ascii", errors="replace")
+
+    raise IOError(f"BYOND server returned an unknown data code: 0x{packet[0]:x}")
+
+
+def get_ss13_status_addr(url: str) -> Tuple[str, int]:
+    if "//" not in url:
+        url = "//" + url
+
+    parsed = urlparse(url, "byond", allow_fragments=False)
+
+    port = parsed.port
+    if not port:
+        raise ValueError("No port specified!")
+
+    return (cast(str, parsed.hostname), cast(int, parsed.port))
+
 
-    raise NotImplementedError(f"Unknown BYOND data code: 0x{packet[0]:x}")
+def parse_ss13_status(
+    response: Union[float, Dict[str, List[str]]], name: str
+) -> Dict[str, Any]:
+    """
+    Turns a `?status` topic response into the same shape as the SS14 status payload.
+
+    `name` is reported as the server name, `?status` doesn't include one.
+    """
+    if not isinstance(response, dict):
+        raise ValueError("Non-list returns are not accepted.")
+
+    def first(key: str) -> Any:
+        values = response.get(key)
+        return values[0] if values else None
+
+    def number(key: str) -> Any:
+        value = first(key)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return value
+
+    players = number("players")
+    if players is None:
+        raise ValueError("Response has no player count.")
+
+    max_players = "?"
+    for key in ("soft_popcap", "popcap", "hard_popcap"):
+        if number(key):
+            max_players = number(key)
+            break
+
+    status: Dict[str, Any] = {
+        "name": name,
+        "players": players,
+        "soft_max_players": max_players,
+        "map": first("map_name") or "?",
+        "preset": first("mode") or "?",
+        "round_id": first("round_id") or "?",
+        "run_level": SS13_GAMESTATE_RUN_LEVEL.get(number("gamestate")),
+    }
+
+    duration = number("round_duration")
+    if isinstance(duration, int):
+        if status["run_level"] is None:
+            status["run_level"] = 1
+        started = datetime.now(timezone.utc) - timedelta(seconds=duration)
+        status["round_start_time"] = started.isoformat()
+
+    return status
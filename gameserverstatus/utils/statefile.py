@@ -0,0 +1,56 @@
+import asyncio
+import gzip
+import json
+import os
+import time
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Bumped whenever the layout of the saved state changes, older files are ignored.
+STATE_VERSION = 1
+
+
+class StateFile:
+    """
+    Gzipped JSON file the cog's runtime state is kept in between reloads.
+
+    Writes go to a temporary file that replaces the old one, so a crash halfway
+    through never leaves a truncated file behind.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    async def save(self, state: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, dict(state, version=STATE_VERSION, saved_at=time.time()))
+
+    async def load(self, max_age: float) -> Optional[Dict[str, Any]]:
+        """
+        Returns the saved state, or None if there is none, it can't be read or it was
+        saved more than `max_age` seconds ago. `saved_at` holds the wall time it was saved at.
+        """
+        state = await asyncio.to_thread(self._read)
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != STATE_VERSION
+            or time.time() - state.get("saved_at", 0) > max_age
+        ):
+            return None
+        return state
+
+    def _write(self, state: Dict[str, Any]) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(state, f, separators=(",", ":"), default=str)
+        os.replace(tmp, self.path)
+
+    def _read(self) -> Any:
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError):
+            # Corrupt or half written by something else, start over.
+            return None
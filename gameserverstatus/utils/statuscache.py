@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class Snapshot(NamedTuple):
+    # Raw status payload as returned by the game server.
+    data: Dict[str, Any]
+    # Wall clock time (time.time()) the payload was fetched at.
+    fetched_at: float
+
+
+class StatusCache:
+    """
+    Status snapshots keyed by normalized status URL.
+
+    Entries younger than `ttl` seconds are served from memory, at most `maxsize`
+    entries are kept (least recently used are evicted first) and concurrent
+    callers for the same key share a single in-flight fetch.
+    """
+
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Snapshot]" = OrderedDict()
+        self._inflight: Dict[str, "asyncio.Task[Snapshot]"] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key: str) -> Optional[Snapshot]:
+        """Returns the latest snapshot for `key`, even if it has expired."""
+        return self._entries.get(key)
+
+    def items(self) -> List[Tuple[str, Snapshot]]:
+        """Returns every cached snapshot, least recently used first."""
+        return list(self._entries.items())
+
+    def put(self, key: str, snapshot: Snapshot) -> None:
+        self._entries[key] = snapshot
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+        max_age: Optional[float] = None,
+    ) -> Snapshot:
+        """
+        Returns the snapshot for `key`, calling `fetch` if there is no fresh one.
+
+        `max_age` lowers the TTL for this lookup.
+        """
+        ttl = self.ttl if max_age is None else min(self.ttl, max_age)
+        entry = self._entries.get(key)
+        if entry is not None and time.time() - entry.fetched_at < ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fill(key, fetch))
+            # Nobody may be left to retrieve the result if every caller got cancelled.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+
+        # Shielded so a caller being cancelled doesn't abort the fetch for everyone else.
+        return await asyncio.shield(task)
+
+    async def _fill(
+        self, key: str, fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Snapshot:
+        try:
+            snapshot = Snapshot(await fetch(), time.time())
+            self.put(key, snapshot)
+            return snapshot
+        finally:
+            del self._inflight[key]
@@ -0,0 +1,187 @@
+"""
+Asyncio UDP client for the A2S (Source) and Quake 3 status query protocols.
+"""
+
+
+import asyncio
+import re
+import struct
+
+from typing import Any, Dict, Optional, Tuple, cast
+from urllib.parse import urlparse
+
+A2S_INFO_REQUEST = b"\xff\xff\xff\xffTSource Engine Query\x00"
+A2S_INFO_RESPONSE = 0x49
+A2S_CHALLENGE_RESPONSE = 0x41
+
+Q3_STATUS_REQUEST = b"\xff\xff\xff\xffgetstatus\n"
+Q3_STATUS_RESPONSE = b"\xff\xff\xff\xffstatusResponse"
+
+# ^1Red^7Name -> RedName
+Q3_COLOR_CODE = re.compile(r"\^.")
+
+Address = Tuple[str, int]
+
+
+class UDPQueryError(Exception):
+    pass
+
+
+class _QueryProtocol(asyncio.DatagramProtocol):
+    def __init__(self, engine: "UDPQueryEngine") -> None:
+        self.engine = engine
+
+    def datagram_received(self, data: bytes, addr: Tuple[Any, ...]) -> None:
+        waiter = self.engine._waiters.get((addr[0], addr[1]))
+        if waiter is not None and not waiter.done():
+            waiter.set_result(data)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors can't be tied back to a server, those queries just time out.
+        pass
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.engine._transport = None
+
+
+class UDPQueryEngine:
+    """
+    Queries many game servers over a single UDP socket.
+
+    Responses are matched to queries by the address they come from, so only one
+    query per server address is in flight at a time. Each query gets `timeout`
+    seconds in total, split over the initial attempt and `retries` resends.
+    """
+
+    def __init__(self, timeout: float, retries: int) -> None:
+        self.timeout = timeout
+        self.retries = retries
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._start_lock = asyncio.Lock()
+        self._waiters: Dict[Address, "asyncio.Future[bytes]"] = {}
+        self._address_locks: Dict[Address, asyncio.Lock] = {}
+
+    async def query(self, protocol: str, ip: str, port: int) -> Dict[str, Any]:
+        """
+        Returns the status of a server in the SS14 payload shape.
+
+        `ip` must be a numeric IPv4 address, responses are matched on it.
+        """
+        address = (ip, port)
+
+        lock = self._address_locks.setdefault(address, asyncio.Lock())
+        async with lock:
+            if protocol == "a2s":
+                return await self._query_a2s(address)
+            elif protocol == "q3":
+                return await self._query_q3(address)
+        raise UDPQueryError(f"Unknown query protocol {protocol}.")
+
+    def close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    async def _exchange(self, address: Address, payload: bytes) -> bytes:
+        if self._transport is None:
+            async with self._start_lock:
+                if self._transport is None:
+                    loop = asyncio.get_running_loop()
+                    self._transport, _ = await loop.create_datagram_endpoint(
+                        lambda: _QueryProtocol(self), local_addr=("0.0.0.0", 0)
+                    )
+
+        attempt_timeout = self.timeout / (self.retries + 1)
+        for attempt in range(self.retries + 1):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters[address] = waiter
+            try:
+                cast(asyncio.DatagramTransport, self._transport).sendto(payload, address)
+                return await asyncio.wait_for(waiter, timeout=attempt_timeout)
+            except asyncio.TimeoutError:
+                if attempt == self.retries:
+                    raise
+            finally:
+                if self._waiters.get(address) is waiter:
+                    del self._waiters[address]
+        raise asyncio.TimeoutError
+
+    async def _query_a2s(self, address: Address) -> Dict[str, Any]:
+        response = await self._exchange(address, A2S_INFO_REQUEST)
+        if len(response) >= 9 and response[4] == A2S_CHALLENGE_RESPONSE:
+            # Servers patched since 2020 want their challenge echoed back first.
+            response = await self._exchange(address, A2S_INFO_REQUEST + response[5:9])
+
+        if len(response) < 6 or response[:4] != b"\xff\xff\xff\xff" or response[4] != A2S_INFO_RESPONSE:
+            raise UDPQueryError("Unexpected A2S response.")
+
+        reader = _Reader(response, 6)  # Header and protocol version.
+        name = reader.string()
+        gamemap = reader.string()
+        reader.string()  # Folder
+        game = reader.string()
+        reader.skip(2)  # Steam app ID
+        players, max_players, bots = reader.bytes(3)
+
+        return {
+            "name": name,
+            "players": max(players - bots, 0),
+            "soft_max_players": max_players,
+            "map": gamemap,
+            "preset": game,
+            "round_id": "?",
+            "run_level": 1,
+        }
+
+    async def _query_q3(self, address: Address) -> Dict[str, Any]:
+        response = await self._exchange(address, Q3_STATUS_REQUEST)
+        if not response.startswith(Q3_STATUS_RESPONSE):
+            raise UDPQueryError("Unexpected Quake 3 response.")
+
+        lines = response.decode("latin-1").split("\n")
+        fields = lines[1].split("\\")[1:] if len(lines) > 1 else []
+        info = dict(zip(fields[::2], fields[1::2]))
+        # Every line after the info string is a player: `score ping "name"`.
+        players = sum(1 for line in lines[2:] if line.strip())
+
+        return {
+            "name": Q3_COLOR_CODE.sub("", info.get("sv_hostname", "?")),
+            "players": players,
+            "soft_max_players": int(info["sv_maxclients"]) if info.get("sv_maxclients", "").isdigit() else "?",
+            "map": info.get("mapname", "?"),
+            "preset": info.get("gamename") or info.get("g_gametype", "?"),
+            "round_id": "?",
+            "run_level": 1,
+        }
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int) -> None:
+        self.data = data
+        self.offset = offset
+
+    def string(self) -> str:
+        end = self.data.find(b"\x00", self.offset)
+        if end == -1:
+            raise UDPQueryError("Truncated response.")
+        value = self.data[self.offset : end].decode("utf-8", errors="replace")
+        self.offset = end + 1
+        return value
+
+    def skip(self, count: int) -> None:
+        self.offset += count
+
+    def bytes(self, count: int) -> Tuple[int, ...]:
+        if self.offset + count > len(self.data):
+            raise UDPQueryError("Truncated response.")
+        values = struct.unpack_from(f"{count}B", self.data, self.offset)
+        self.offset += count
+        return values
+
+
+def get_udp_status_addr(url: str, default_port: int) -> Address:
+    if "//" not in url:
+        url = "//" + url
+
+    parsed = urlparse(url, "udp", allow_fragments=False)
+    return (cast(str, parsed.hostname), parsed.port or default_port)
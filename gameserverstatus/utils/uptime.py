@@ -0,0 +1,283 @@
+import asyncio
+import sqlite3
+import time
+
+from array import array
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Rolling windows uptime is reported over, in hours.
+UPTIME_WINDOWS = {"24h": 24, "7d": 7 * 24, "30d": 30 * 24}
+# Hour buckets kept per server, enough for the longest window.
+UPTIME_HOURS = max(UPTIME_WINDOWS.values())
+
+# Closed outages older than this many hours are deleted.
+OUTAGE_RETENTION = 90 * 24
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS availability (
+    key TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    up INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    latency REAL NOT NULL,
+    timed INTEGER NOT NULL,
+    PRIMARY KEY (key, hour)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS outages (
+    key TEXT NOT NULL,
+    start REAL NOT NULL,
+    end REAL,
+    error TEXT NOT NULL,
+    PRIMARY KEY (key, start)
+) WITHOUT ROWID;
+"""
+
+
+class Outage(NamedTuple):
+    start: float
+    # None while the server is still down.
+    end: Optional[float]
+    # Exception type name of the first failed poll.
+    error: str
+
+
+class Availability(NamedTuple):
+    # Fraction of polls that succeeded, None without polls in the window.
+    uptime: Optional[float]
+    polls: int
+    # Mean latency of the polls in the window that reached the server, in seconds.
+    latency: float
+
+
+class UptimeCounter:
+    """
+    Poll results of one server in hourly buckets, with running sums per window.
+
+    Recording a sample only touches the current bucket and the sums, moving into a
+    new hour drops the buckets that fell out of each window from its sum.
+    """
+
+    __slots__ = ("hour", "up", "total", "timed", "latency", "sums")
+
+    def __init__(self, hour: int) -> None:
+        self.reset(hour)
+
+    def reset(self, hour: int) -> None:
+        self.hour = hour
+        self.up = array("I", [0]) * UPTIME_HOURS
+        self.total = array("I", [0]) * UPTIME_HOURS
+        # Polls that reached the server, only those have a latency.
+        self.timed = array("I", [0]) * UPTIME_HOURS
+        self.latency = array("d", [0.0]) * UPTIME_HOURS
+        # Window hours -> [up, total, timed, latency] over that window.
+        self.sums: Dict[int, List[float]] = {hours: [0, 0, 0, 0.0] for hours in UPTIME_WINDOWS.values()}
+
+    def advance(self, hour: int) -> None:
+        if hour <= self.hour:
+            return
+
+        if hour - self.hour >= UPTIME_HOURS:
+            self.reset(hour)
+            return
+
+        for h in range(self.hour + 1, hour + 1):
+            for hours, sums in self.sums.items():
+                gone = (h - hours) % UPTIME_HOURS
+                sums[0] -= self.up[gone]
+                sums[1] -= self.total[gone]
+                sums[2] -= self.timed[gone]
+                sums[3] -= self.latency[gone]
+
+            slot = h % UPTIME_HOURS
+            self.up[slot] = 0
+            self.total[slot] = 0
+            self.timed[slot] = 0
+            self.latency[slot] = 0.0
+        self.hour = hour
+
+    def add(self, hour: int, up: int, total: int, timed: int, latency: float) -> None:
+        """Adds counts to the bucket of `hour`, which may be up to a window behind the newest."""
+        self.advance(hour)
+        age = self.hour - hour
+        if age >= UPTIME_HOURS:
+            return
+
+        slot = hour % UPTIME_HOURS
+        self.up[slot] += up
+        self.total[slot] += total
+        self.timed[slot] += timed
+        self.latency[slot] += latency
+        for hours, sums in self.sums.items():
+            if age < hours:
+                sums[0] += up
+                sums[1] += total
+                sums[2] += timed
+                sums[3] += latency
+
+    def bucket(self, hour: int) -> Tuple[int, int, float, int]:
+        slot = hour % UPTIME_HOURS
+        return self.up[slot], self.total[slot], self.latency[slot], self.timed[slot]
+
+    def availability(self, hours: int, now_hour: int) -> Availability:
+        self.advance(now_hour)
+        up, total, timed, latency = self.sums[hours]
+        if not total:
+            return Availability(None, 0, 0.0)
+        return Availability(up / total, int(total), latency / timed if timed else 0.0)
+
+
+class UptimeTracker:
+    """
+    Uptime per status key over rolling windows, and the outages behind it.
+
+    Every poll result is folded into an `UptimeCounter` in O(1). An outage starts
+    at the first failed poll and ends at the next successful one. Hour buckets and
+    outages are written to SQLite on `flush` and read back by `load`.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = asyncio.Lock()
+        self._counters: Dict[str, UptimeCounter] = {}
+        # key -> start of the outage the server is in right now, and its error.
+        self._down: Dict[str, Tuple[float, str]] = {}
+        # Hour buckets and outages changed since the last flush.
+        self._dirty: Dict[Tuple[str, int], None] = {}
+        self._outage_writes: List[Tuple[str, float, Optional[float], str]] = []
+
+    def record(
+        self, key: str, up: bool, latency: Optional[float], when: float, error: Optional[str] = None
+    ) -> None:
+        """
+        Records the result of one poll. `latency` is None for a poll that never reached
+        the server, it counts against uptime but not towards the mean latency.
+        """
+        hour = int(when) // 3600
+        counter = self._counters.get(key)
+        if counter is None:
+            counter = self._counters[key] = UptimeCounter(hour)
+        counter.add(hour, int(up), 1, int(latency is not None), latency or 0.0)
+        self._dirty[(key, hour)] = None
+
+        down = self._down.get(key)
+        if up and down is not None:
+            del self._down[key]
+            self._outage_writes.append((key, down[0], when, down[1]))
+        elif not up and down is None:
+            self._down[key] = (when, error or "Unknown")
+            self._outage_writes.append((key, when, None, error or "Unknown"))
+
+    def availability(self, key: str) -> Dict[str, Availability]:
+        """Returns the availability of `key` over every window in `UPTIME_WINDOWS`."""
+        counter = self._counters.get(key)
+        now_hour = int(time.time()) // 3600
+        return {
+            name: counter.availability(hours, now_hour)
+            if counter is not None
+            else Availability(None, 0, 0.0)
+            for name, hours in UPTIME_WINDOWS.items()
+        }
+
+    def down_since(self, key: str) -> Optional[float]:
+        down = self._down.get(key)
+        return down[0] if down is not None else None
+
+    async def outages(self, key: str, since: float) -> List[Outage]:
+        """Returns the outages of `key` that were still going on at `since`, newest first."""
+        await self.flush()
+        async with self._lock:
+            return await asyncio.to_thread(self._read_outages, key, since)
+
+    async def load(self) -> None:
+        """Reads the stored buckets and open outages back, adding to anything recorded already."""
+        async with self._lock:
+            buckets, open_outages = await asyncio.to_thread(self._read_state)
+
+        for key, hour, up, total, latency, timed in buckets:
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = self._counters[key] = UptimeCounter(hour)
+            counter.add(hour, up, total, timed, latency)
+
+        for key, start, error in open_outages:
+            self._down.setdefault(key, (start, error))
+
+    async def flush(self) -> None:
+        async with self._lock:
+            buckets = [
+                (key, hour, *self._counters[key].bucket(hour))
+                for key, hour in self._dirty
+                if self._counters[key].hour - hour < UPTIME_HOURS
+            ]
+            outages, self._outage_writes = self._outage_writes, []
+            self._dirty = {}
+            if buckets or outages:
+                await asyncio.to_thread(self._write, buckets, outages)
+
+    async def close(self) -> None:
+        await self.flush()
+        async with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(SCHEMA)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(availability)")}
+            if "timed" not in columns:
+                # Files from before polls rejected by an open circuit were told apart,
+                # every poll in them was timed.
+                with self._conn:
+                    self._conn.execute(
+                        "ALTER TABLE availability ADD COLUMN timed INTEGER NOT NULL DEFAULT 0"
+                    )
+                    self._conn.execute("UPDATE availability SET timed = total")
+        return self._conn
+
+    def _write(
+        self,
+        buckets: List[Tuple[str, int, int, int, float, int]],
+        outages: List[Tuple[str, float, Optional[float], str]],
+    ) -> None:
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO availability (key, hour, up, total, latency, timed) VALUES (?, ?, ?, ?, ?, ?)",
+                buckets,
+            )
+            conn.executemany("INSERT OR REPLACE INTO outages VALUES (?, ?, ?, ?)", outages)
+
+            hour = int(time.time()) // 3600
+            conn.execute("DELETE FROM availability WHERE hour <= ?", (hour - UPTIME_HOURS,))
+            conn.execute(
+                "DELETE FROM outages WHERE end < ?", ((hour - OUTAGE_RETENTION) * 3600,)
+            )
+
+    def _read_state(
+        self,
+    ) -> Tuple[List[Tuple[str, int, int, int, float, int]], List[Tuple[str, float, str]]]:
+        conn = self._connect()
+        hour = int(time.time()) // 3600
+        buckets = conn.execute(
+            "SELECT key, hour, up, total, latency, timed FROM availability WHERE hour > ? ORDER BY hour",
+            (hour - UPTIME_HOURS,),
+        ).fetchall()
+        open_outages = conn.execute(
+            "SELECT key, start, error FROM outages WHERE end IS NULL"
+        ).fetchall()
+        return buckets, open_outages
+
+    def _read_outages(self, key: str, since: float) -> List[Outage]:
+        rows = self._connect().execute(
+            """
+            SELECT start, end, error FROM outages
+            WHERE key = ? AND (end IS NULL OR end >= ?)
+            ORDER BY start DESC
+            """,
+            (key, since),
+        )
+        return [Outage(*row) for row in rows]
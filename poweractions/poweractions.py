@@ -179,7 +179,7 @@ class poweractions(commands.Cog):
             
             servername, server = foundServer
 
-            async with aiohttp.ClientSession() as session:
+            async with self.make_session() as session:
                 try:
                     status, response = await doaction(session, server, "restart")
                     if status != 200:
@@ -219,7 +219,7 @@ class poweractions(commands.Cog):
 
             servername, server = foundServer
 
-            async with aiohttp.ClientSession() as session:
+            async with self.make_session() as session:
                 try:
                     status, response = await doaction(session, server, "update")
                     if status != 200:
@@ -259,7 +259,7 @@ class poweractions(commands.Cog):
             
             servername, server = foundServer
 
-            async with aiohttp.ClientSession() as session:
+            async with self.make_session() as session:
                 try:
                     status, response = await doaction(session, server, "stop")
                     if status != 200:
@@ -289,6 +289,16 @@ class poweractions(commands.Cog):
 
         return (server, selectedserver[server])
 
+    def make_session(self) -> aiohttp.ClientSession:
+        # Share GameServerStatus's caching resolver when it is loaded, the watchdogs
+        # are usually on the same hosts it polls.
+        resolver = getattr(self.bot.get_cog("GameServerStatus"), "resolver", None)
+        if resolver is None:
+            return aiohttp.ClientSession()
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(resolver=resolver, use_dns_cache=False)
+        )
+
     @checks.admin()
     @commands.hybrid_command()
     async def restartnetwork(self, ctx: commands.Context) -> None:
@@ -310,7 +320,7 @@ class poweractions(commands.Cog):
                 embed = Embed(title="Network Restart", description="Results of the restarts",
                               color=await ctx.embed_colour())
 
-                async with aiohttp.ClientSession() as session:
+                async with self.make_session() as session:
                     for server_name, server_details in network_data.items():
                         try:
                             status, response = await doaction(session, server_details, "restart")